@@ -1,20 +1,85 @@
 ## app.py
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, url_for, Response, stream_with_context
 import os
-from scrapers.booking_scraper import scrape_booking_reviews
-from scrapers.utils import validate_booking_url, extract_property_info
+import gzip
+import atexit
+from scrapers.driver_pool import DriverPool
+from scrapers.jobs import JobManager
+from scrapers.cache import ResultCache
+from scrapers.metrics import REGISTRY
+from scrapers.storage import ReviewStore
+from scrapers.search import SearchIndex, FACETS
+from scrapers.normalize import frame_to_records
+from scrapers.streaming import (NDJSON_MIMETYPE, iter_frame_records, iter_ndjson, iter_gzip,
+                                parse_paging, parse_count, parse_number)
+from scrapers.utils import validate_booking_url, extract_property_info, property_key, configure_logging
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Log to the console and to a timestamped file; an empty SCRAPER_LOG_DIR logs to the console only
+configure_logging(os.environ.get('SCRAPER_LOG_DIR', 'logs') or None)
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.urandom(24)
 
+# Shared browser sessions, borrowed by every scrape instead of cold-starting Chrome
+driver_pool = DriverPool(
+    size=int(os.environ.get('SCRAPER_POOL_SIZE', 2)),
+    max_uses=int(os.environ.get('SCRAPER_POOL_MAX_USES', 20))
+)
+atexit.register(driver_pool.close)
+
+# Start Chrome in the background so the first scrape does not wait for it, without delaying startup
+if os.environ.get('SCRAPER_PREWARM', '').lower() in ('1', 'true', 'yes'):
+    driver_pool.prewarm()
+
+# Optional browserless backend; scrapes fall back to the pool when it finds no reviews
+http_fetcher = None
+if os.environ.get('SCRAPER_BACKEND', 'selenium') == 'http':
+    from scrapers.fetchers import HttpFetcher
+    http_fetcher = HttpFetcher(max_concurrency=int(os.environ.get('SCRAPER_HTTP_CONCURRENCY', 4)))
+    atexit.register(http_fetcher.close)
+
+# Typed, indexed store that every scrape is also written to
+review_store = ReviewStore(os.environ.get('SCRAPER_DB_PATH', 'reviews.db'))
+
+# Keyword and facet index over every scraped review, kept in the review store's database by default
+search_index = SearchIndex(os.environ.get('SCRAPER_SEARCH_DB') or review_store.path)
+
+# How browser scrapes reach each page of reviews, and how many sessions one scrape may use
+scrape_navigation = os.environ.get('SCRAPER_NAVIGATION', 'direct')
+scrape_sessions = int(os.environ.get('SCRAPER_PAGE_SESSIONS', 1))
+
+# Recent results per property, so repeated requests skip the scrape entirely
+result_cache = ResultCache(
+    ttl=float(os.environ.get('SCRAPER_CACHE_TTL', 900)),
+    max_entries=int(os.environ.get('SCRAPER_CACHE_SIZE', 64)),
+    disk_dir=os.environ.get('SCRAPER_CACHE_DIR') or None
+)
+
+# Background executor for asynchronous /api/booking requests
+job_manager = JobManager(
+    max_workers=int(os.environ.get('SCRAPER_JOB_WORKERS', 2)),
+    cache=result_cache,
+    pool=driver_pool,
+    fetcher=http_fetcher,
+    store=review_store,
+    search_index=search_index,
+    navigation=scrape_navigation,
+    sessions=scrape_sessions
+)
+atexit.register(job_manager.shutdown)
+
+def cached_scrape(url, max_reviews, incremental=False):
+    """Scrape a property with the shared pool, fetcher and store, answering from the cache when possible."""
+    # Selenium and pandas are loaded with the scraper on the first scrape, not at startup
+    from scrapers.booking_scraper import scrape_booking_reviews
+    
+    scrape = lambda: scrape_booking_reviews(url, max_reviews, pool=driver_pool, fetcher=http_fetcher,
+                                            incremental=incremental, store=review_store,
+                                            search_index=search_index, navigation=scrape_navigation, sessions=scrape_sessions)
+    return result_cache.get_or_scrape(url, max_reviews, scrape, incremental)
+
 @app.route('/', methods=['GET', 'POST'])
 def index():
     message = None
@@ -36,8 +101,8 @@ def index():
             # Get property info for file naming
             property_type, country_code, property_name = extract_property_info(url)
             
-            # Call the scraper
-            df = scrape_booking_reviews(url, max_reviews)
+            # Call the scraper, or reuse a recent result for this property
+            df = cached_scrape(url, max_reviews)
             
             if not df.empty:
                 # Get the filename that was used to save the CSV
@@ -57,6 +122,67 @@ def index():
     
     return render_template('index.html', message=message, result=result)
 
+def reviews_payload(url, max_reviews, df):
+    """Build the JSON response body for a finished scrape."""
+    # Get property info for response
+    property_type, country_code, property_name = extract_property_info(url)
+    
+    # Convert DataFrame to JSON-safe dictionaries with ISO dates
+    reviews_list = frame_to_records(df)
+    
+    return {
+        "success": True,
+        "url": url,
+        "property_name": property_name,
+        "max_reviews_requested": max_reviews,
+        "reviews_returned": len(reviews_list),
+        "reviews": reviews_list
+    }
+
+def wants_ndjson(params):
+    """True if the client asked for newline-delimited JSON instead of one JSON document."""
+    return params.get('format') == 'ndjson' or request.accept_mimetypes.best == NDJSON_MIMETYPE
+
+def accepts_gzip():
+    return 'gzip' in request.accept_encodings
+
+def ndjson_response(records, headers=None):
+    """Stream records as NDJSON while they are produced, gzip-compressed if the client accepts it."""
+    headers = dict(headers or {})
+    chunks = iter_ndjson(records)
+    if accepts_gzip():
+        chunks = iter_gzip(chunks)
+        headers['Content-Encoding'] = 'gzip'
+        headers['Vary'] = 'Accept-Encoding'
+    return Response(stream_with_context(chunks), mimetype=NDJSON_MIMETYPE, headers=headers)
+
+def json_response(payload, status=200):
+    """jsonify a payload, gzip-compressing the body if the client accepts it."""
+    response = jsonify(payload)
+    response.status_code = status
+    if accepts_gzip():
+        response.set_data(gzip.compress(response.get_data()))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+def reviews_response(url, max_reviews, df, params, offset=0, limit=None):
+    """
+    Return one page of a scrape result, as a JSON document or a streamed NDJSON response.
+    
+    The result is already in memory, so NDJSON only spares building the encoded document;
+    /api/reviews streams from the store instead and keeps memory flat.
+    """
+    total = len(df)
+    page = df.iloc[offset:] if limit is None else df.iloc[offset:offset + limit]
+    
+    if wants_ndjson(params):
+        return ndjson_response(iter_frame_records(page), headers={'X-Total-Count': str(total)})
+    
+    payload = reviews_payload(url, max_reviews, page)
+    payload.update(total_reviews=total, offset=offset, limit=limit)
+    return json_response(payload)
+
 @app.route('/api/booking', methods=['POST'])
 def api_booking():
     """
@@ -64,9 +190,15 @@ def api_booking():
     Accepts JSON input in the form:
     {
       "url": "https://www.booking.com/hotel/gb/london-visitors.html",
-      "max_reviews": 100  # Optional
+      "max_reviews": 100,  # Optional
+      "async": true,       # Optional, return a job id instead of waiting
+      "incremental": true, # Optional, only fetch reviews newer than the saved CSV
+      "offset": 0,         # Optional, skip this many reviews of the result
+      "limit": 50,         # Optional, return at most this many reviews
+      "format": "ndjson"   # Optional, stream one review per line
     }
-    Returns JSON with the scraped reviews or an error.
+    Returns JSON with the scraped reviews or an error. In async mode returns
+    202 with a job id to poll at /api/booking/<job_id>.
     """
     try:
         data = request.json
@@ -74,7 +206,7 @@ def api_booking():
             return jsonify({"error": "No JSON payload provided."}), 400
         
         url = data.get('url')
-        max_reviews = data.get('max_reviews')  # Optional
+        incremental = bool(data.get('incremental'))  # Optional
         
         if not url:
             return jsonify({"error": "Booking.com URL is required."}), 400
@@ -83,30 +215,163 @@ def api_booking():
         if not validate_booking_url(url):
             return jsonify({"error": "Invalid Booking.com URL format."}), 400
         
-        # Call the scraper
-        df = scrape_booking_reviews(url, max_reviews)
+        try:
+            max_reviews = parse_count(data, 'max_reviews')  # Optional
+            offset, limit = parse_paging(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        if data.get('async'):
+            job, created = job_manager.submit(url, max_reviews, incremental)
+            return jsonify({
+                "job_id": job.id,
+                "status": job.status,
+                "deduplicated": not created,
+                "status_url": url_for('api_booking_status', job_id=job.id),
+                "result_url": url_for('api_booking_result', job_id=job.id)
+            }), 202
+        
+        # Call the scraper, or reuse a recent result for this property
+        df = cached_scrape(url, max_reviews, incremental)
         
         if df.empty:
             return jsonify({"error": "No reviews found or an error occurred."}), 200
         
-        # Get property info for response
-        property_type, country_code, property_name = extract_property_info(url)
-        
-        # Convert DataFrame to list of dictionaries
-        reviews_list = df.to_dict(orient='records')
-        
-        return jsonify({
-            "success": True,
-            "url": url,
-            "property_name": property_name,
-            "max_reviews_requested": max_reviews,
-            "reviews_returned": len(reviews_list),
-            "reviews": reviews_list
-        }), 200
+        return reviews_response(url, max_reviews, df, data, offset, limit)
     
     except Exception as e:
         logger.error(f"[ERROR] /api/booking -> {e}")
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/booking/<job_id>', methods=['GET'])
+def api_booking_status(job_id):
+    """Return the status and progress of a background scrape job."""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown or expired job id."}), 404
+    
+    return jsonify(job.to_dict()), 200
+
+@app.route('/api/booking/<job_id>/result', methods=['GET'])
+def api_booking_result(job_id):
+    """Return the reviews of a finished background scrape job, paged with ?offset=&limit=."""
+    try:
+        offset, limit = parse_paging(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown or expired job id."}), 404
+    
+    if not job.done:
+        return jsonify(dict(job.to_dict(), error="Job has not finished yet.")), 409
+    
+    if job.error:
+        return jsonify({"error": job.error, "job_id": job.id}), 200
+    
+    return reviews_response(job.url, job.max_reviews, job.result, request.args, offset, limit)
+
+@app.route('/api/reviews', methods=['GET'])
+def api_reviews():
+    """
+    Page through the stored reviews of a property without scraping.
+    
+    Query parameters: url (required), offset, limit (default 100, at most
+    1000), since/until (ISO review dates), min_rating/max_rating, and
+    format=ndjson to stream every matching review instead of one page.
+    """
+    url = request.args.get('url')
+    if not url or not validate_booking_url(url):
+        return jsonify({"error": "A valid Booking.com URL is required."}), 400
+    
+    ndjson = wants_ndjson(request.args)
+    try:
+        offset, limit = parse_paging(request.args, default_limit=None if ndjson else 100,
+                                     max_limit=None if ndjson else 1000)
+        filters = {
+            'prop': property_key(url),
+            'since': request.args.get('since'),
+            'until': request.args.get('until'),
+            'min_rating': parse_number(request.args, 'min_rating'),
+            'max_rating': parse_number(request.args, 'max_rating')
+        }
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    # Pages follow the store's unique order (see storage.QUERY_ORDER), so consecutive
+    # offsets never return a review twice or skip one
+    total = review_store.count(**filters)
+    if ndjson:
+        records = review_store.iter_query(limit=limit, offset=offset, **filters)
+        return ndjson_response(records, headers={'X-Total-Count': str(total)})
+    
+    reviews_list = review_store.query(limit=limit, offset=offset, **filters)
+    next_offset = offset + len(reviews_list)
+    return json_response({
+        "success": True,
+        "url": url,
+        "property": filters['prop'],
+        "total_reviews": total,
+        "offset": offset,
+        "limit": limit,
+        "reviews_returned": len(reviews_list),
+        "next_offset": next_offset if next_offset < total else None,
+        "reviews": reviews_list
+    })
+
+@app.route('/api/search', methods=['GET'])
+def api_search():
+    """
+    Search the reviews of every scraped property without scraping.
+    
+    Query parameters: q (words that must all appear in the title, pros or
+    cons; end a word with * to match it as a prefix), url to search one
+    property only, country, traveler_type, room_type and rating (the whole
+    number of the score), each repeatable to match any of several values,
+    offset and limit (default 20, at most 100).
+    """
+    url = request.args.get('url')
+    if url and not validate_booking_url(url):
+        return jsonify({"error": "A valid Booking.com URL is required."}), 400
+    
+    query = request.args.get('q', '').strip()
+    facets = {facet: request.args.getlist(facet) for facet in FACETS if request.args.getlist(facet)}
+    try:
+        offset, limit = parse_paging(request.args, default_limit=20, max_limit=100)
+        found = search_index.search(query, prop=property_key(url) if url else None, facets=facets,
+                                    limit=limit, offset=offset)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    next_offset = offset + len(found['results'])
+    return json_response({
+        "success": True,
+        "query": query,
+        "filters": facets,
+        "total_reviews": found['total'],
+        "offset": offset,
+        "limit": limit,
+        "reviews_returned": len(found['results']),
+        "next_offset": next_offset if next_offset < found['total'] else None,
+        "reviews": found['results'],
+        "facets": found['facets']
+    })
+
+@app.route('/api/cache', methods=['GET'])
+def api_cache():
+    """Return result cache hit/miss counters."""
+    return jsonify(result_cache.stats()), 200
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Export scrape stage timings, selector fallbacks and cache counters for Prometheus."""
+    cache_stats = result_cache.stats()
+    lines = [REGISTRY.to_prometheus()]
+    for name in ('hits', 'misses', 'evictions'):
+        lines.append(f"# TYPE scraper_cache_{name}_total counter\n"
+                     f"scraper_cache_{name}_total {cache_stats[name]}\n")
+    return Response("".join(lines), mimetype='text/plain; version=0.0.4')
+
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,253 @@
+# benchmarks/fake_driver.py
+import re
+import time
+from collections import Counter
+from urllib.parse import urlparse, parse_qs
+import soupsieve as sv
+from bs4 import BeautifulSoup
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from scrapers.extraction import EXTRACT_REVIEWS_JS, REVIEW_COUNT_JS, PAGE_PROBLEM_JS
+from scrapers.parser import element_text, find_review_count, find_page_problem
+
+# XPath subset used by the scraper: unions of //tag[cond or cond ...] where each
+# condition is contains(text()|@attr, 'value') or text()|@attr = 'value'
+XPATH_STEP = re.compile(r"^//(\*|[\w-]+)\[(.*)\]$")
+XPATH_CONDITION = re.compile(r"^(contains\()?\s*(text\(\)|@[\w-]+)\s*(?:,|=)\s*'([^']*)'\s*\)?$")
+
+def _own_text(tag):
+    return "".join(str(child) for child in tag.children if isinstance(child, str))
+
+def _xpath_matches(tag, conditions):
+    for is_contains, target, value in conditions:
+        if target == 'text()':
+            actual = _own_text(tag)
+        else:
+            actual = tag.get(target[1:], "")
+            if isinstance(actual, list):
+                actual = " ".join(actual)
+        if (value in actual) if is_contains else (actual.strip() == value):
+            return True
+    return False
+
+def select_xpath(root, expression):
+    """Evaluate the small XPath subset the scraper uses against a BeautifulSoup tree."""
+    steps = []
+    for part in expression.split(" | "):
+        match = XPATH_STEP.match(part.strip())
+        if not match:
+            raise NotImplementedError(f"Unsupported XPath: {expression}")
+
+        conditions = []
+        for condition in re.split(r"\s+or\s+", match.group(2)):
+            parsed = XPATH_CONDITION.match(condition.strip())
+            if not parsed:
+                raise NotImplementedError(f"Unsupported XPath condition: {condition}")
+            conditions.append((bool(parsed.group(1)), parsed.group(2), parsed.group(3)))
+        steps.append((match.group(1), conditions))
+
+    # A union returns its nodes in document order, without duplicates
+    return [tag for tag in root.find_all(True)
+            if any((name == '*' or tag.name == name) and _xpath_matches(tag, conditions)
+                   for name, conditions in steps)]
+
+class FakeElement:
+    """A WebElement stand-in backed by a BeautifulSoup tag; goes stale when its page is replaced."""
+
+    def __init__(self, driver, tag, generation):
+        self._driver = driver
+        self._tag = tag
+        self._generation = generation
+
+    def _command(self, name):
+        self._driver._command(name)
+        if self._generation != self._driver.generation:
+            raise StaleElementReferenceException("Element is no longer attached to the page")
+
+    @property
+    def text(self):
+        self._command('element_text')
+        return element_text(self._tag)
+
+    @property
+    def tag_name(self):
+        self._command('element_tag_name')
+        return self._tag.name
+
+    def get_attribute(self, name):
+        self._command('element_attribute')
+        value = self._tag.get(name)
+        return " ".join(value) if isinstance(value, list) else value
+
+    def is_displayed(self):
+        self._command('element_displayed')
+        return True
+
+    def is_enabled(self):
+        self._command('element_enabled')
+        return not self._tag.has_attr('disabled')
+
+    def find_elements(self, by=By.ID, value=None):
+        self._command('element_find_elements')
+        return self._driver._wrap(self._driver._select(self._tag, by, value))
+
+    def find_element(self, by=By.ID, value=None):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element matches {value}")
+        return elements[0]
+
+    def click(self):
+        self._command('element_click')
+        self._driver._activate(self._tag)
+
+class FakeDriver:
+    """
+    A WebDriver stand-in that renders a FixtureSite without a browser.
+
+    Implements the calls the scraper makes (get, find_elements, execute_script,
+    page_source, ...) and counts every one of them as a round trip, optionally
+    sleeping `latency` seconds per call to model a remote chromedriver.
+
+    Args:
+        site (FixtureSite): Property whose pages are served
+        latency (float): Seconds added to every round trip
+    """
+
+    def __init__(self, site, latency=0.0):
+        self.site = site
+        self.latency = latency
+        self.commands = Counter()
+        self.generation = 0
+        self.page_index = None
+        self.cookies_accepted = False
+        self.url = "about:blank"
+        self._soup = BeautifulSoup("<html><body></body></html>", 'lxml')
+        self._html = str(self._soup)
+
+    @property
+    def round_trips(self):
+        return sum(self.commands.values())
+
+    def _command(self, name):
+        self.commands[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _load(self, page_index, html=None):
+        """Replace the document, invalidating every element handed out, with a property page by default."""
+        self.page_index = page_index
+        if html is None:
+            html = ("<html><body></body></html>" if page_index is None else
+                    self.site.property_page(page_index, show_cookie_banner=not self.cookies_accepted))
+        self._html = html
+        self._soup = BeautifulSoup(html, 'lxml')
+        self.generation += 1
+
+    def _wrap(self, tags):
+        return [FakeElement(self, tag, self.generation) for tag in tags]
+
+    def _select(self, root, by, value):
+        if by == By.CSS_SELECTOR:
+            return sv.select(value, root)
+        if by == By.XPATH:
+            return select_xpath(root, value)
+        if by == By.ID:
+            return root.find_all(id=value)
+        raise NotImplementedError(f"Unsupported locator strategy: {by}")
+
+    def _activate(self, tag):
+        """Apply the effect of clicking `tag`."""
+        label = tag.get('aria-label', "") + " " + tag.get_text()
+        if tag.get('id') == 'onetrust-accept-btn-handler':
+            self.cookies_accepted = True
+            tag.decompose()
+        elif 'Next' in label and self.page_index is not None:
+            if self.page_index + 1 < self.site.page_count:
+                self._load(self.page_index + 1)
+        elif tag.get_text().strip().isdigit():
+            self._load(int(tag.get_text().strip()) - 1)
+
+    # WebDriver API
+
+    def get(self, url):
+        self._command('get')
+        self.url = url
+        if url == "about:blank":
+            self._load(None)
+            return
+
+        parsed = urlparse(url)
+        if parsed.path.endswith("/reviewlist.html"):
+            query = parse_qs(parsed.query)
+            offset = int(query.get('offset', ["0"])[0])
+            rows = int(query.get('rows', ["25"])[0])
+            self._load(None, self.site.review_list(offset, rows))
+        else:
+            self._load(0)
+
+    @property
+    def current_url(self):
+        self._command('current_url')
+        return self.url
+
+    @property
+    def window_handles(self):
+        self._command('window_handles')
+        return ["fixture-window"]
+
+    @property
+    def page_source(self):
+        self._command('page_source')
+        return str(self._soup)
+
+    def find_elements(self, by=By.ID, value=None):
+        self._command('find_elements')
+        return self._wrap(self._select(self._soup, by, value))
+
+    def find_element(self, by=By.ID, value=None):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element matches {value}")
+        return elements[0]
+
+    def execute_script(self, script, *args):
+        self._command('execute_script')
+
+        if script == EXTRACT_REVIEWS_JS:
+            return self._extract_reviews(*args)
+        if script == REVIEW_COUNT_JS:
+            found = find_review_count(self._soup)
+            return list(found) if found else None
+        if script == PAGE_PROBLEM_JS:
+            return find_page_problem(self._soup, args[3])
+        if "document.readyState" in script:
+            return "complete"
+        if "arguments[0].click()" in script:
+            element = args[0]
+            if element._generation != self.generation:
+                raise StaleElementReferenceException("Element is no longer attached to the page")
+            self._activate(element._tag)
+        return None
+
+    def _extract_reviews(self, card_selector, field_selectors):
+        """Evaluate EXTRACT_REVIEWS_JS in Python, returning what the browser would."""
+        cards = []
+        for card in sv.select(card_selector, self._soup):
+            fields = {}
+            for field, options in field_selectors.items():
+                fields[field] = None
+                for option_idx, (selector, match_idx) in enumerate(options):
+                    matches = sv.select(selector, card, limit=match_idx + 1)
+                    if len(matches) > match_idx:
+                        fields[field] = [element_text(matches[match_idx]), option_idx]
+                        break
+            cards.append({'fields': fields, 'text': element_text(card)})
+        return cards
+
+    def delete_all_cookies(self):
+        self._command('delete_all_cookies')
+        self.cookies_accepted = False
+
+    def quit(self):
+        self._command('quit')
@@ -0,0 +1,117 @@
+# benchmarks/fixtures.py
+import os
+import glob
+from bs4 import BeautifulSoup
+from scrapers.parser import CARD_SELECTOR
+
+COUNTRIES = ["United States", "United Kingdom", "Germany", "Canada", "Brazil"]
+TRAVELER_TYPES = ["Family", "Couple", "Solo traveler", "Business", "Group"]
+MONTHS = ["January", "February", "March", "April", "May", "June",
+          "July", "August", "September", "October", "November", "December"]
+
+def review_card(i, legacy=False):
+    """
+    Return the HTML of one review card in Booking.com's markup.
+
+    Legacy cards use the older class-based markup, so the fallback selectors
+    are exercised as well as the data-testid ones.
+    """
+    month = MONTHS[i % 12]
+    score = f"{5 + i % 6}.0"
+
+    if legacy:
+        title = f'<h3 class="f6431b446c c5811cad6b ee8547574e">Stay number {i}</h3>'
+        stay = f'<span class="abf093bdfe d88f1120c1">{month} 2024</span>'
+        texts = (f'<div class="c402354066"><div class="a53cbfa6de">Great location, review {i}</div></div>'
+                 f'<div class="c402354066"><div class="a53cbfa6de">Small bathroom</div></div>')
+    else:
+        title = f'<h3 data-testid="review-title">Stay number {i}</h3>'
+        stay = f'<span data-testid="review-stay-date">{month} 2024</span>'
+        texts = (f'<div data-testid="review-positive-text"><div class="a53cbfa6de">Great location, '
+                 f'<b>friendly</b> staff, review {i}</div></div>'
+                 f'<div data-testid="review-negative-text"><div class="a53cbfa6de">Small bathroom</div></div>')
+
+    return f"""<div data-testid="review-card" class="c-review-block">
+<div class="reviewer"><div class="a3332d346a e6208ee469">Guest {i}</div>
+<span class="afac1f68d9 a1ad95c055">{COUNTRIES[i % len(COUNTRIES)]}</span></div>
+<ul><li><span data-testid="review-room-name">Deluxe King Room</span></li>
+<li><span data-testid="review-num-nights">{1 + i % 7} nights ·</span>{stay}</li>
+<li><span data-testid="review-traveler-type">{TRAVELER_TYPES[i % len(TRAVELER_TYPES)]}</span></li></ul>
+<span data-testid="review-date">Reviewed: {1 + i % 28} {month} 2025</span>
+<div class="a3b8729ab1"><div>Scored {score}</div><div>{score}</div></div>
+{title}
+{texts}
+</div>"""
+
+class FixtureSite:
+    """
+    A stand-in Booking.com property built from a list of review cards.
+
+    Renders the property page (cookie banner, review count, one page of cards
+    and a Next button) and the paginated review list served over HTTP.
+
+    Args:
+        cards (list): HTML of every review card, newest first
+        per_page (int): Cards shown per property page, as on booking.com
+    """
+
+    def __init__(self, cards, per_page=10):
+        self.cards = cards
+        self.per_page = per_page
+
+    @classmethod
+    def generated(cls, total_reviews, per_page=10, legacy_every=4):
+        """Build a site with `total_reviews` synthetic cards; every `legacy_every`th uses legacy markup."""
+        cards = [review_card(i, legacy=bool(legacy_every) and i % legacy_every == legacy_every - 1)
+                 for i in range(total_reviews)]
+        return cls(cards, per_page)
+
+    @classmethod
+    def from_directory(cls, directory, per_page=10):
+        """Build a site from the review cards of saved review pages (*.html, in name order)."""
+        cards = []
+        for path in sorted(glob.glob(os.path.join(directory, "*.html"))):
+            with open(path, encoding='utf-8') as f:
+                soup = BeautifulSoup(f.read(), 'lxml')
+            cards.extend(str(card) for card in CARD_SELECTOR.select(soup))
+
+        if not cards:
+            raise ValueError(f"No review cards found in {directory}")
+        return cls(cards, per_page)
+
+    @property
+    def total_reviews(self):
+        return len(self.cards)
+
+    @property
+    def page_count(self):
+        return -(-len(self.cards) // self.per_page)
+
+    def property_page(self, page_index, show_cookie_banner=True):
+        """Return the property page showing the `page_index`th page of reviews."""
+        start = page_index * self.per_page
+        cards = "".join(self.cards[start:start + self.per_page])
+        banner = ('<div id="onetrust-banner-sdk"><button id="onetrust-accept-btn-handler">Accept</button></div>'
+                  if show_cookie_banner else "")
+        next_button = ('<button aria-label="Next page" class="pagination-next">Next page</button>'
+                       if page_index + 1 < self.page_count else "")
+        count = f"{self.total_reviews:,}"
+
+        json_ld = ('{"@context": "https://schema.org", "@type": "Hotel", "name": "Fixture property", '
+                   f'"aggregateRating": {{"@type": "AggregateRating", "ratingValue": 8.4, '
+                   f'"reviewCount": {self.total_reviews}}}}}')
+
+        return f"""<html><head><title>Fixture property</title>
+<script type="application/ld+json">{json_ld}</script></head><body>
+{banner}
+<nav><a href="#tab-reviews">Reviews</a></nav>
+<div id="reviews"><h2>Guest reviews ({count})</h2>
+<span class="review-score-count">{count} reviews</span>
+<div class="review-list">{cards}</div>
+<div class="pagination">{next_button}</div></div>
+</body></html>"""
+
+    def review_list(self, offset, rows):
+        """Return the review list fragment served at reviewlist.html for `offset` and `rows`."""
+        cards = "".join(self.cards[offset:offset + rows])
+        return f'<html><body><div class="review_list">{cards}</div></body></html>'
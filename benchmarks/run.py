@@ -0,0 +1,350 @@
+# benchmarks/run.py
+"""
+Offline scraper benchmarks.
+
+Replays fixture review pages through a fake WebDriver and a local HTTP server
+and measures throughput, WebDriver round trips, peak memory and latency of
+scrape_booking_reviews and /api/booking, plus how long the app and the
+scraper take to import. Results are written as JSON so runs can be compared
+over time.
+
+Usage:
+    python -m benchmarks.run [--reviews 100] [--scenarios selenium-js,http]
+                             [--fixtures DIR] [--compare benchmarks/results/<earlier>.json]
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.fixtures import FixtureSite
+from benchmarks.fake_driver import FakeDriver
+from benchmarks.server import LocalReviewServer
+
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+PROPERTY_URL = "https://www.booking.com/hotel/us/fixture-property.html"
+SCENARIOS = ['selenium-js', 'selenium-html', 'selenium-element', 'selenium-click', 'selenium-parallel',
+             'http', 'api', 'startup']
+
+# Modules timed by the startup scenario, and the dependencies they should only load when scraping
+STARTUP_MODULES = ['app', 'scrapers.booking_scraper']
+HEAVY_MODULES = ['pandas', 'selenium', 'webdriver_manager', 'bs4', 'requests']
+
+# Figures compared between runs, and whether a higher value is better
+COMPARED_FIGURES = [
+    ('reviews_per_sec', True),
+    ('reviews_per_sec_excluding_waits', True),
+    ('round_trips_per_review', False),
+    ('peak_memory_mb', False),
+    ('latency_seconds', False)
+]
+
+def git_commit():
+    """Return the current commit hash, marked '-dirty' with uncommitted changes, or None."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except Exception:
+        return None
+
+def wait_seconds(trace):
+    """Seconds the scrape spent in WebDriver waits, which a fake driver makes artificial."""
+    return sum(entry['total'] for entry in trace.waits.values())
+
+def fake_pool(site, latency, size=1):
+    """Return a DriverPool of FakeDrivers and the list of drivers it has started."""
+    from scrapers.driver_pool import DriverPool
+
+    drivers = []
+    def factory():
+        driver = FakeDriver(site, latency)
+        drivers.append(driver)
+        return driver
+
+    return DriverPool(size=size, driver_factory=factory), drivers
+
+def selenium_scenario(site, args, extraction, navigation='direct', sessions=1):
+    """Scrape through pooled FakeDrivers with one extraction mode and navigation."""
+    from scrapers.booking_scraper import scrape_booking_reviews
+    from scrapers.metrics import Metrics, ScrapeTrace
+
+    pool, drivers = fake_pool(site, args.latency, size=sessions)
+
+    def run():
+        round_trips = sum(driver.round_trips for driver in drivers)
+        trace = ScrapeTrace(registry=Metrics())
+        df = scrape_booking_reviews(PROPERTY_URL, args.reviews, pool=pool, page_timeout=args.page_timeout,
+                                    extraction=extraction, resume=False, trace=trace,
+                                    navigation=navigation, sessions=sessions)
+        return {
+            'reviews': len(df),
+            'round_trips': sum(driver.round_trips for driver in drivers) - round_trips,
+            'wait_seconds': wait_seconds(trace)
+        }
+
+    return run, pool.close
+
+def http_scenario(site, args):
+    """Scrape through HttpFetcher against a local review list server."""
+    from scrapers.booking_scraper import scrape_booking_reviews
+    from scrapers.fetchers import HttpFetcher
+    from scrapers.metrics import Metrics, ScrapeTrace
+
+    server = LocalReviewServer(site).start()
+    fetcher = HttpFetcher(base_url=server.review_list_url)
+
+    def run():
+        requests_served = server.requests
+        trace = ScrapeTrace(registry=Metrics())
+        df = scrape_booking_reviews(PROPERTY_URL, args.reviews, fetcher=fetcher, resume=False, trace=trace)
+        return {
+            'reviews': len(df),
+            'round_trips': 0,
+            'http_requests': server.requests - requests_served,
+            'wait_seconds': 0.0
+        }
+
+    def close():
+        fetcher.close()
+        server.stop()
+
+    return run, close
+
+def api_scenario(site, args):
+    """POST to /api/booking through Flask's test client, with the app's pool replaced by FakeDrivers."""
+    import app as web_app
+    from scrapers.cache import ResultCache
+
+    pool, drivers = fake_pool(site, args.latency)
+    web_app.driver_pool = pool
+    web_app.http_fetcher = None
+    # A zero TTL makes every request miss the cache, so each one measures a full scrape
+    web_app.result_cache = ResultCache(ttl=0)
+    client = web_app.app.test_client()
+
+    def run():
+        round_trips = sum(driver.round_trips for driver in drivers)
+        response = client.post('/api/booking', json={'url': PROPERTY_URL, 'max_reviews': args.reviews})
+        payload = response.get_json()
+        return {
+            'reviews': payload.get('reviews_returned', 0),
+            'round_trips': sum(driver.round_trips for driver in drivers) - round_trips,
+            'response_bytes': len(response.data),
+            'wait_seconds': None
+        }
+
+    return run, pool.close
+
+def measure_startup(repeat):
+    """
+    Time a cold import of each of STARTUP_MODULES in a fresh interpreter.
+
+    Also reports which HEAVY_MODULES each import pulled in, so a dependency
+    that is loaded at startup again shows up in the results. None of them
+    should be: they are imported by the functions that need them.
+    """
+    script = ("import sys, time; start = time.perf_counter(); import {module}; "
+              "print(time.perf_counter() - start); print(','.join(m for m in {heavy!r} if m in sys.modules))")
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT, SCRAPER_LOG_DIR="")
+
+    summary = {'runs': repeat, 'import_seconds': {}, 'heavy_modules_loaded': {}}
+    for module in STARTUP_MODULES:
+        seconds = []
+        for _ in range(repeat):
+            output = subprocess.run([sys.executable, "-c", script.format(module=module, heavy=HEAVY_MODULES)],
+                                    env=env, capture_output=True, text=True, check=True).stdout.splitlines()
+            seconds.append(float(output[0]))
+        summary['import_seconds'][module] = round(statistics.median(seconds), 4)
+        summary['heavy_modules_loaded'][module] = [m for m in output[1].split(",") if m]
+
+    # Compared between runs like the other scenarios' latency
+    summary['latency_seconds'] = summary['import_seconds']['app']
+    return summary
+
+def measure(run, repeat):
+    """
+    Run a scenario `repeat` times for timing, then once more under tracemalloc.
+
+    Tracing slows Python down, so peak memory is taken from a separate run
+    rather than skewing the timed ones.
+    """
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        result['seconds'] = time.perf_counter() - start
+        runs.append(result)
+
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    seconds = statistics.median(r['seconds'] for r in runs)
+    reviews = runs[-1]['reviews']
+    summary = {
+        'reviews': reviews,
+        'runs': len(runs),
+        'latency_seconds': round(seconds, 4),
+        'latency_max_seconds': round(max(r['seconds'] for r in runs), 4),
+        'reviews_per_sec': round(reviews / seconds, 2) if seconds else None,
+        'round_trips': runs[-1]['round_trips'],
+        'round_trips_per_review': round(runs[-1]['round_trips'] / reviews, 3) if reviews else None,
+        'peak_memory_mb': round(peak / 2 ** 20, 3)
+    }
+
+    waits = [r['wait_seconds'] for r in runs if r.get('wait_seconds') is not None]
+    if waits:
+        busy = seconds - statistics.median(waits)
+        summary['wait_seconds'] = round(statistics.median(waits), 4)
+        summary['reviews_per_sec_excluding_waits'] = round(reviews / busy, 2) if busy > 0 else None
+    for key in ('http_requests', 'response_bytes'):
+        if key in runs[-1]:
+            summary[key] = runs[-1][key]
+    return summary
+
+def compare(current, previous_path):
+    """Print how each scenario's figures changed since an earlier results file."""
+    with open(previous_path, encoding='utf-8') as f:
+        previous = json.load(f)
+
+    print(f"\nCompared with {previous_path} (commit {previous['meta'].get('commit')}):")
+    for name, figures in current['scenarios'].items():
+        before = previous['scenarios'].get(name)
+        if before is None:
+            continue
+        changes = []
+        for figure, higher_is_better in COMPARED_FIGURES:
+            old, new = before.get(figure), figures.get(figure)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100
+            better = change > 0 if higher_is_better else change < 0
+            changes.append(f"{figure} {old} -> {new} ({change:+.1f}%{', better' if better and abs(change) >= 5 else ''})")
+        print(f"  {name}: " + "; ".join(changes))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scraper against offline fixture pages.")
+    parser.add_argument('--reviews', type=int, default=100, help="reviews per scrape (default 100)")
+    parser.add_argument('--per-page', type=int, default=10, help="reviews per property page (default 10)")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per scenario (default 3)")
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help="seconds added to every fake WebDriver call, to model a remote browser")
+    parser.add_argument('--sessions', type=int, default=3,
+                        help="browser sessions for the selenium-parallel scenario (default 3)")
+    parser.add_argument('--page-timeout', type=float, default=5, help="scraper page_timeout (default 5)")
+    parser.add_argument('--scenarios', default=",".join(SCENARIOS),
+                        help=f"comma-separated subset of {','.join(SCENARIOS)}")
+    parser.add_argument('--fixtures', help="directory of saved review pages (*.html) to replay "
+                                           "instead of generated ones")
+    parser.add_argument('--output', help="results file (default benchmarks/results/<timestamp>.json)")
+    parser.add_argument('--compare', help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    if args.fixtures:
+        site = FixtureSite.from_directory(args.fixtures, args.per_page)
+    else:
+        site = FixtureSite.generated(args.reviews, args.per_page)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    output = os.path.abspath(output)
+
+    # The scraper writes CSVs, checkpoints and the review store to the working
+    # directory, so run it in a scratch one; the app reads its settings at import
+    workdir = tempfile.mkdtemp(prefix="scraper-bench-")
+    os.chdir(workdir)
+    os.environ.setdefault('CHROMEDRIVER_PATH', "chromedriver-unused")
+    os.environ['SCRAPER_DB_PATH'] = os.path.join(workdir, "reviews.db")
+    os.environ['SCRAPER_BACKEND'] = 'selenium'
+    os.environ['SCRAPER_LOG_DIR'] = ""
+    logging.disable(logging.INFO)
+
+    builders = {
+        'selenium-js': lambda: selenium_scenario(site, args, 'js'),
+        'selenium-html': lambda: selenium_scenario(site, args, 'html'),
+        'selenium-element': lambda: selenium_scenario(site, args, 'element'),
+        'selenium-click': lambda: selenium_scenario(site, args, 'js', navigation='click'),
+        'selenium-parallel': lambda: selenium_scenario(site, args, 'js', sessions=args.sessions),
+        'http': lambda: http_scenario(site, args),
+        'api': lambda: api_scenario(site, args)
+    }
+
+    results = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform()
+        },
+        'config': {
+            'reviews': args.reviews,
+            'fixture_reviews': site.total_reviews,
+            'per_page': args.per_page,
+            'repeat': args.repeat,
+            'latency': args.latency,
+            'sessions': args.sessions,
+            'page_timeout': args.page_timeout,
+            'fixtures': args.fixtures or "generated"
+        },
+        'scenarios': {}
+    }
+
+    eager_imports = []
+    for name in scenarios:
+        if name == 'startup':
+            summary = results['scenarios'][name] = measure_startup(args.repeat)
+            for module, seconds in summary['import_seconds'].items():
+                loaded = ", ".join(summary['heavy_modules_loaded'][module]) or "nothing heavy"
+                print(f"{'import ' + module:32} {seconds}s  loads {loaded}")
+                if summary['heavy_modules_loaded'][module]:
+                    eager_imports.append(f"{module} ({loaded})")
+            continue
+
+        run, close = builders[name]()
+        try:
+            summary = measure(run, args.repeat)
+        finally:
+            close()
+        results['scenarios'][name] = summary
+        print(f"{name:17} {summary['reviews']:5} reviews  {summary['reviews_per_sec']:9} reviews/s  "
+              f"{summary['round_trips_per_review']} round trips/review  "
+              f"{summary['peak_memory_mb']} MB peak  {summary['latency_seconds']}s")
+
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+    # Results are kept either way, but a heavy import at startup fails the run
+    if eager_imports:
+        raise SystemExit("Heavy dependencies loaded at import time: " + "; ".join(eager_imports))
+
+    return results
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/server.py
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+class LocalReviewServer:
+    """
+    Serve a FixtureSite's review list over HTTP on localhost, for the HTTP backend.
+
+    Use as a context manager; `review_list_url` is the base_url to give HttpFetcher.
+
+    Args:
+        site (FixtureSite): Property whose reviews are served
+    """
+
+    def __init__(self, site):
+        self.site = site
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path != "/reviewlist.html":
+                    self.send_error(404)
+                    return
+
+                query = parse_qs(parsed.query)
+                offset = int(query.get('offset', ["0"])[0])
+                rows = int(query.get('rows', ["25"])[0])
+                body = server.site.review_list(offset, rows).encode('utf-8')
+                with server._lock:
+                    server.requests += 1
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    @property
+    def review_list_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/reviewlist.html"
+
+    def start(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,147 @@
+# scrapers/batch.py
+import time
+import threading
+import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
+from scrapers.booking_scraper import scrape_booking_reviews
+from scrapers.utils import validate_booking_url
+
+logger = logging.getLogger(__name__)
+
+# One finished property: `reviews` is a DataFrame, or None when `error` is set
+BatchResult = namedtuple('BatchResult', ['url', 'reviews', 'error', 'attempts', 'seconds'])
+
+class HostRateLimiter:
+    """Space out requests to the same host by at least `min_interval` seconds."""
+
+    def __init__(self, min_interval=2.0):
+        self.min_interval = min_interval
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        """Block until a request to the host of `url` is allowed."""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+def scrape_many(urls, max_reviews=None, max_workers=4, host_interval=2.0,
+                job_timeout=None, retries=1, **scrape_kwargs):
+    """
+    Scrape many Booking.com properties concurrently, yielding each as it completes.
+
+    Args:
+        urls (iterable): Booking.com property URLs
+        max_reviews (int, optional): Maximum number of reviews per property
+        max_workers (int): Global limit on properties scraped at once
+        host_interval (float): Minimum seconds between scrape starts per host
+        job_timeout (float, optional): Seconds after which a running property
+                                       counts as timed out. Its retry only
+                                       starts once the abandoned attempt has
+                                       returned, since both would write the
+                                       same CSV and checkpoint; if it has not
+                                       returned within another job_timeout,
+                                       the property is given up on.
+        retries (int): Extra attempts for a property that fails or times out
+        **scrape_kwargs: Passed to scrape_booking_reviews (pool, fetcher, ...)
+
+    Yields:
+        BatchResult: One per URL, in completion order
+    """
+    limiter = HostRateLimiter(host_interval)
+
+    def run(url, job):
+        limiter.wait(url)
+        job['started'] = time.monotonic()
+        df = scrape_booking_reviews(url, max_reviews, **scrape_kwargs)
+        if df.empty:
+            raise RuntimeError("No reviews were scraped")
+        return df
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch-scrape")
+    # future -> job details; 'started' stays None while the job is queued
+    running = {}
+    # Timed-out attempts still running, whose retry waits for them; 'stalled' is when they timed out
+    stalled = {}
+
+    def submit(url, attempt):
+        job = {'url': url, 'attempt': attempt, 'started': None}
+        running[executor.submit(run, url, job)] = job
+
+    def result(job, reviews, error, now):
+        seconds = now - job['started'] if job['started'] is not None else 0.0
+        return BatchResult(job['url'], reviews, error, job['attempt'], round(seconds, 3))
+
+    try:
+        for url in urls:
+            if not validate_booking_url(url):
+                yield BatchResult(url, None, "Invalid Booking.com URL", 0, 0.0)
+                continue
+            submit(url, 1)
+
+        while running or stalled:
+            # Wake up in time to notice the next job that runs past its timeout,
+            # polling while some jobs are still queued and have no start time
+            timeout = None
+            if job_timeout is not None:
+                deadlines = [job['started'] + job_timeout for job in running.values() if job['started'] is not None]
+                deadlines += [job['stalled'] + job_timeout for job in stalled.values()]
+                timeout = max(0, min(deadlines) - time.monotonic()) if deadlines else 1.0
+                if any(job['started'] is None for job in running.values()):
+                    timeout = min(timeout, 1.0)
+
+            done, _ = wait(list(running) + list(stalled), timeout=timeout, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+
+            # A stalled attempt has returned, so its retry can no longer collide with it
+            for future in [future for future in stalled if future in done]:
+                job = stalled.pop(future)
+                logger.warning(f"Retrying {job['url']} now that timed-out attempt {job['attempt']} has returned")
+                submit(job['url'], job['attempt'] + 1)
+            for future in [future for future, job in stalled.items() if now - job['stalled'] >= job_timeout]:
+                job = stalled.pop(future)
+                error = f"Timed out after {job_timeout:.0f}s and did not return, so it was not retried"
+                logger.error(f"Giving up on {job['url']} after {job['attempt']} attempts: {error}")
+                yield result(job, None, error, job['stalled'])
+
+            finished = [(future, None) for future in done if future in running]
+            if job_timeout is not None:
+                finished += [(future, f"Timed out after {job_timeout:.0f}s")
+                             for future, job in running.items()
+                             if future not in done and job['started'] is not None
+                             and now - job['started'] >= job_timeout]
+
+            for future, timeout_error in finished:
+                job = running.pop(future)
+                url, attempt = job['url'], job['attempt']
+                error = timeout_error
+                reviews = None
+
+                if error is None:
+                    try:
+                        reviews = future.result()
+                    except Exception as e:
+                        error = str(e)
+
+                if error and attempt <= retries:
+                    if timeout_error:
+                        logger.warning(f"Attempt {attempt} for {url} timed out; retrying once it returns")
+                        job['stalled'] = now
+                        stalled[future] = job
+                    else:
+                        logger.warning(f"Retrying {url} after attempt {attempt} failed: {error}")
+                        submit(url, attempt + 1)
+                    continue
+
+                if error:
+                    logger.error(f"Giving up on {url} after {attempt} attempts: {error}")
+                yield result(job, reviews, error, now)
+
+    finally:
+        executor.shutdown(wait=False)
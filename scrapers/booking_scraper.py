@@ -1,273 +1,183 @@
 # scrapers/booking_scraper.py
-import time
-import pandas as pd
-import re
 import os
-from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+import time
+import threading
+from contextlib import contextmanager, ExitStack
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from scrapers.utils import extract_property_info
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+from scrapers.utils import (
+    review_fingerprint, build_review_list_url, property_key, parse_review_count, REVIEWS_PER_PAGE
 )
-logger = logging.getLogger(__name__)
-
-# Create logs directory if it doesn't exist
-log_dir = "logs"
-if not os.path.exists(log_dir):
-    os.makedirs(log_dir)
-
-# Create log filename with timestamp
-log_filename = os.path.join(log_dir, f"scraper_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-
-# Configure logger
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_filename),
-        logging.StreamHandler()  # This will continue to print to console as well
-    ]
+from scrapers.extraction import (
+    REVIEW_CARD_SELECTOR, FIELD_SELECTORS, OUTPUT_COLUMNS, EXTRACT_REVIEWS_JS, REVIEW_COUNT_SELECTORS,
+    REVIEW_COUNT_PATTERNS, REVIEW_COUNT_JS, REVIEW_LIST_SELECTOR, CHALLENGE_SELECTORS, CHALLENGE_PATTERNS,
+    CONSENT_SELECTORS, PAGE_PROBLEM_JS, build_review_record
 )
+from scrapers.sinks import CsvSink, MemorySink
+from scrapers.checkpoint import Checkpoint
+from scrapers.storage import SqliteSink
+from scrapers.search import SearchSink
+from scrapers.normalize import normalize_reviews, normalize_records
+from scrapers.driver_pool import setup_driver, quit_driver
+from scrapers.waits import WaitBudget, wait_for_document_ready, wait_for_review_cards, wait_for_page_change
+from scrapers.metrics import ScrapeTrace
+from scrapers.throttle import AdaptiveThrottle, throttle_for
+
+# Logging is set up by the application, see scrapers.utils.configure_logging
 logger = logging.getLogger(__name__)
 
-def setup_driver():
-    """Set up and return a configured Chrome WebDriver instance."""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    # Add user-agent to avoid detection
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    return driver
+# Review totals per property, reused by later scrapes for REVIEW_COUNT_TTL seconds
+REVIEW_COUNT_TTL = 3600
+_review_counts = {}
+_review_counts_lock = threading.Lock()
 
-def get_review_count(driver, url):
-    """Extract the total number of reviews from the hotel page."""
+def get_review_count(driver, url, budget=None, use_cache=True):
+    """
+    Read the total number of reviews from the property page the driver has open.
+    
+    The page is not reloaded. The total comes from the page's JSON-LD
+    aggregateRating or, failing that, a few targeted elements, read in one
+    script call. A total found for a property is reused for REVIEW_COUNT_TTL
+    seconds, so repeat and incremental scrapes skip the lookup.
+    
+    Args:
+        driver: WebDriver with the property page loaded
+        url (str): URL of the Booking.com property
+        budget (WaitBudget, optional): Wait limits used if the total is not shown yet
+        use_cache (bool): Reuse a total found by an earlier scrape
+    
+    Returns:
+        int: Total number of reviews, or 0 if it could not be found
+    """
+    budget = budget or WaitBudget()
+    key = property_key(url) or url
+    
+    if use_cache:
+        with _review_counts_lock:
+            cached = _review_counts.get(key)
+        if cached and time.monotonic() - cached[1] < REVIEW_COUNT_TTL:
+            logger.info(f"Using cached review count for {key}")
+            return cached[0]
+    
     try:
-        # Navigate to the reviews tab
-        if '#tab-reviews' not in url:
-            reviews_url = f"{url}#tab-reviews"
-        else:
-            reviews_url = url
-            
-        driver.get(reviews_url)
-        time.sleep(5)  # Allow page to load
-        
-        # Try to find elements that contain review counts
-        count_elements = driver.find_elements(By.XPATH, 
-                                             "//*[contains(text(), 'reviews') or contains(text(), 'Reviews')]")
-        
-        for element in count_elements:
-            text = element.text
-            match = re.search(r'(\d[\d,\.]+)\s*reviews', text, re.IGNORECASE)
-            if match:
-                count = match.group(1).replace(',', '').replace('.', '')
-                return int(count)
-        
-        # If the above didn't work, try another approach
-        heading_element = driver.find_element(By.XPATH, "//h2[contains(text(), 'Guest reviews')]")
-        if heading_element:
-            heading_text = heading_element.text
-            match = re.search(r'(\d[\d,\.]+)', heading_text)
-            if match:
-                count = match.group(1).replace(',', '').replace('.', '')
-                return int(count)
-                
-        return 0
+        found = driver.execute_script(REVIEW_COUNT_JS, REVIEW_COUNT_SELECTORS, REVIEW_COUNT_PATTERNS)
+        if not found:
+            # Structured data is in the initial HTML; the review widgets may render later
+            wait_for_review_cards(driver, budget, label='review_count_load')
+            found = driver.execute_script(REVIEW_COUNT_JS, REVIEW_COUNT_SELECTORS, REVIEW_COUNT_PATTERNS)
+        
+        count = parse_review_count(found[1]) if found else None
+        if not count:
+            logger.warning("Review count not found on the page")
+            return 0
+        
+        logger.info(f"Read review count from {found[0]}")
+        with _review_counts_lock:
+            _review_counts[key] = (count, time.monotonic())
+        return count
         
     except Exception as e:
         logger.error(f"Error getting review count: {e}")
         return 0
 
-def scrape_reviews_from_page(driver):
-    """Extract all reviews from the current page with targeted element extraction."""
+def extract_card_fields(container, trace=None):
+    """Collect the raw text of every review field from one card element."""
+    from selenium.webdriver.common.by import By
+    
+    trace = trace or ScrapeTrace()
+    fields = {}
+    
+    for field, options in FIELD_SELECTORS.items():
+        fields[field] = None
+        # Every selector tried is a WebDriver round trip, so fallbacks show up as time per field
+        with trace.span('field_selector', field=field):
+            for option_idx, (selector, match_idx) in enumerate(options):
+                # find_elements returns an empty list on a miss instead of raising
+                matches = container.find_elements(By.CSS_SELECTOR, selector)
+                if len(matches) > match_idx:
+                    fields[field] = (matches[match_idx].text, option_idx)
+                    break
+    
+    trace.count_fields(fields)
+    return fields
+
+def extract_reviews_js(driver, trace=None):
+    """Extract every review card on the page with a single execute_script call."""
+    try:
+        cards = driver.execute_script(EXTRACT_REVIEWS_JS, REVIEW_CARD_SELECTOR, FIELD_SELECTORS)
+    except Exception as e:
+        logger.warning(f"Bulk review extraction failed: {e}")
+        return []
+    
     reviews = []
+    for idx, card in enumerate(cards or []):
+        try:
+            text = card.get('text') or ""
+            if trace is not None:
+                trace.count_fields(card['fields'])
+            reviews.append(build_review_record(card['fields'], lambda: text))
+        except Exception as e:
+            logger.error(f"Error extracting review {idx}: {str(e)}")
+    return reviews
+
+def scrape_reviews_from_page(driver, budget=None, extraction='js', trace=None):
+    """
+    Extract all reviews from the current page.
+    
+    Args:
+        driver: WebDriver positioned on a page of reviews
+        budget (WaitBudget, optional): Wait limits and timings for this scrape
+        extraction (str): 'js' to read every card with one in-browser script,
+                          falling back to 'element' if that fails,
+                          'html' to parse one page_source snapshot offline, or
+                          'element' for one WebDriver lookup per field
+        trace (ScrapeTrace, optional): Collects selector and fallback counters
+    
+    Returns:
+        list: Review dicts for the cards on the page
+    """
+    from scrapers.parser import parse_reviews
+    
+    reviews = []
+    budget = budget or WaitBudget()
+    trace = trace or ScrapeTrace()
     
     try:
-        # Wait for reviews to load
-        time.sleep(5)
-        
-        # The main review containers on Booking.com
-        review_containers = driver.find_elements(By.CSS_SELECTOR, "[data-testid='review-card']")
+        # Wait for the main review containers on Booking.com to load and settle
+        review_containers = wait_for_review_cards(driver, budget)
         
         logger.info(f"Found {len(review_containers)} review containers")
         
+        if extraction == 'html' and review_containers:
+            reviews = parse_reviews(driver.page_source, trace)
+            if len(reviews) == len(review_containers):
+                return reviews
+            
+            trace.inc('extraction_fallbacks', mode=extraction)
+            logger.warning(f"HTML parsing returned {len(reviews)} of {len(review_containers)} reviews, "
+                           f"falling back to per-element extraction")
+            reviews = []
+        
+        if extraction == 'js' and review_containers:
+            reviews = extract_reviews_js(driver, trace)
+            if len(reviews) == len(review_containers):
+                return reviews
+            
+            trace.inc('extraction_fallbacks', mode=extraction)
+            logger.warning(f"Bulk extraction returned {len(reviews)} of {len(review_containers)} reviews, "
+                           f"falling back to per-element extraction")
+            reviews = []
+        
         for idx, container in enumerate(review_containers):
             try:
-                review_data = {}
-                
-                # Get reviewer name
-                try:
-                    name_element = container.find_element(By.CSS_SELECTOR, ".a3332d346a.e6208ee469")
-                    review_data['reviewer_name'] = name_element.text.strip()
-                except:
-                    review_data['reviewer_name'] = "Anonymous"
-                
-                # Get reviewer country
-                try:
-                    country_element = container.find_element(By.CSS_SELECTOR, ".afac1f68d9.a1ad95c055")
-                    review_data['reviewer_country'] = country_element.text.strip()
-                except:
-                    review_data['reviewer_country'] = ""
-                
-                # Get review date
-                try:
-                    date_element = container.find_element(By.CSS_SELECTOR, "[data-testid='review-date']")
-                    date_text = date_element.text.strip()
-                    if "Reviewed:" in date_text:
-                        review_data['review_date'] = date_text.replace("Reviewed:", "").strip()
-                    else:
-                        review_data['review_date'] = date_text
-                except:
-                    review_data['review_date'] = ""
-                
-                # Get rating score
-                try:
-                    rating_element = container.find_element(By.CSS_SELECTOR, ".a3b8729ab1 div + div")
-                    review_data['rating'] = rating_element.text.strip()
-                except:
-                    try:
-                        # Alternative selector
-                        rating_element = container.find_element(By.CSS_SELECTOR, ".a3b8729ab1")
-                        review_data['rating'] = rating_element.text.replace("Scored", "").strip()
-                    except:
-                        review_data['rating'] = ""
-                
-                # Get review title
-                try:
-                    title_element = container.find_element(By.CSS_SELECTOR, "[data-testid='review-title']")
-                    review_data['review_title'] = title_element.text.strip()
-                except:
-                    try:
-                        # Alternative class-based selector
-                        title_element = container.find_element(By.CSS_SELECTOR, ".f6431b446c.c5811cad6b.ee8547574e")
-                        review_data['review_title'] = title_element.text.strip()
-                    except:
-                        review_data['review_title'] = ""
-                
-                # Get room type
-                try:
-                    room_element = container.find_element(By.CSS_SELECTOR, "[data-testid='review-room-name']")
-                    review_data['room_type'] = room_element.text.strip()
-                except:
-                    try:
-                        # Alternative selector based on the structure
-                        room_element = container.find_element(By.CSS_SELECTOR, ".abf093bdfe:not(.d88f1120c1):not(.f45d8e4c32):not(.a1ad95c055)")
-                        if "Double" in room_element.text or "King" in room_element.text or "Room" in room_element.text:
-                            review_data['room_type'] = room_element.text.strip()
-                        else:
-                            review_data['room_type'] = ""
-                    except:
-                        review_data['room_type'] = ""
+                # Fetch the card text at most once, and only if a fallback needs it
+                container_text = []
+                def get_container_text(container=container, cache=container_text):
+                    if not cache:
+                        cache.append(container.text)
+                    return cache[0]
                 
-                # Get nights stayed
-                try:
-                    nights_element = container.find_element(By.CSS_SELECTOR, "[data-testid='review-num-nights']")
-                    nights_text = nights_element.text.strip()
-                    if "nights" in nights_text or "night" in nights_text:
-                        nights_match = re.search(r'(\d+)\s*night', nights_text)
-                        if nights_match:
-                            review_data['nights_stayed'] = nights_match.group(1)
-                        else:
-                            review_data['nights_stayed'] = nights_text
-                    else:
-                        review_data['nights_stayed'] = nights_text
-                except:
-                    # Fall back to regex on container text
-                    try:
-                        container_text = container.text
-                        nights_match = re.search(r'(\d+)\s*nights?', container_text)
-                        if nights_match:
-                            review_data['nights_stayed'] = nights_match.group(1)
-                        else:
-                            review_data['nights_stayed'] = ""
-                    except:
-                        review_data['nights_stayed'] = ""
-                
-                # Get stay date
-                try:
-                    date_element = container.find_element(By.CSS_SELECTOR, "[data-testid='review-stay-date']")
-                    review_data['stay_date'] = date_element.text.strip()
-                except:
-                    # Try to find with class
-                    try:
-                        date_element = container.find_element(By.CSS_SELECTOR, ".d88f1120c1")
-                        review_data['stay_date'] = date_element.text.strip()
-                    except:
-                        review_data['stay_date'] = ""
-                
-                # Get traveler type
-                try:
-                    traveler_element = container.find_element(By.CSS_SELECTOR, "[data-testid='review-traveler-type']")
-                    review_data['review_type'] = traveler_element.text.strip()
-                except:
-                    # Try common traveler types via text search
-                    container_text = container.text
-                    traveler_types = ["Family", "Solo traveler", "Solo traveller", "Couple", "Business", "Group", "Friends"]
-                    for t_type in traveler_types:
-                        if t_type in container_text:
-                            review_data['review_type'] = t_type
-                            break
-                    else:
-                        review_data['review_type'] = ""
-                
-                # Get positive review text
-                try:
-                    pos_element = container.find_element(By.CSS_SELECTOR, "[data-testid='review-positive-text'] .a53cbfa6de")
-                    review_data['review_pros'] = pos_element.text.strip()
-                except:
-                    # Try alternative selector
-                    try:
-                        pos_element = container.find_element(By.CSS_SELECTOR, ".c402354066 .a53cbfa6de")
-                        if pos_element:
-                            review_data['review_pros'] = pos_element.text.strip()
-                        else:
-                            review_data['review_pros'] = ""
-                    except:
-                        review_data['review_pros'] = ""
-                
-                # Get negative review text
-                try:
-                    neg_element = container.find_element(By.CSS_SELECTOR, "[data-testid='review-negative-text'] .a53cbfa6de")
-                    review_data['review_cons'] = neg_element.text.strip()
-                except:
-                    # Try alternative selector based on the positive then next sibling
-                    try:
-                        neg_elements = container.find_elements(By.CSS_SELECTOR, ".c402354066 .a53cbfa6de")
-                        if len(neg_elements) > 1:
-                            review_data['review_cons'] = neg_elements[1].text.strip()
-                        else:
-                            review_data['review_cons'] = ""
-                    except:
-                        review_data['review_cons'] = ""
-                
-                # Combine pros and cons for full review text
-                if review_data['review_pros'] or review_data['review_cons']:
-                    review_text = ""
-                    if review_data['review_pros']:
-                        review_text += f"Pros: {review_data['review_pros']}\n"
-                    if review_data['review_cons']:
-                        review_text += f"Cons: {review_data['review_cons']}"
-                    review_data['review_text'] = review_text.strip()
-                else:
-                    review_data['review_text'] = ""
-                
-                reviews.append(review_data)
+                reviews.append(build_review_record(extract_card_fields(container, trace), get_container_text))
                 
             except Exception as e:
                 logger.error(f"Error extracting review {idx}: {str(e)}")
@@ -278,9 +188,16 @@ def scrape_reviews_from_page(driver):
     
     return reviews
 
-def go_to_next_page(driver):
+def go_to_next_page(driver, budget=None):
     """Navigate to the next page of reviews if available."""
+    from selenium.webdriver.common.by import By
+    
+    budget = budget or WaitBudget()
+    
     try:
+        # Remember the current cards so we can tell when pagination replaced them
+        old_cards = driver.find_elements(By.CSS_SELECTOR, REVIEW_CARD_SELECTOR)
+        
         # Look for next page button
         next_buttons = driver.find_elements(By.XPATH, 
                                           "//button[contains(@aria-label, 'Next') or contains(text(), 'Next')] | //a[contains(@class, 'next') or contains(@aria-label, 'Next')]")
@@ -289,11 +206,10 @@ def go_to_next_page(driver):
             if button.is_displayed() and button.is_enabled():
                 # Scroll to the button to make it clickable
                 driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                time.sleep(1)
                 
                 # Click using JavaScript to avoid element intercept issues
                 driver.execute_script("arguments[0].click();", button)
-                time.sleep(3)  # Wait for the page to load
+                wait_for_page_change(driver, old_cards, budget)
                 return True
         
         # If no dedicated next button found, try pagination by numbers
@@ -318,9 +234,8 @@ def go_to_next_page(driver):
             for link in next_page_links:
                 if link.is_displayed():
                     driver.execute_script("arguments[0].scrollIntoView(true);", link)
-                    time.sleep(1)
                     driver.execute_script("arguments[0].click();", link)
-                    time.sleep(3)
+                    wait_for_page_change(driver, old_cards, budget)
                     return True
         
         logger.info("No next page button found or reached the last page")
@@ -330,45 +245,214 @@ def go_to_next_page(driver):
         logger.error(f"Error navigating to next page: {e}")
         return False
 
-def scrape_booking_reviews(url, max_reviews=None):
+@contextmanager
+def borrow_driver(pool=None, trace=None, timeout=None):
+    """Yield a driver from `pool`, or a dedicated one that is quit afterwards."""
+    trace = trace or ScrapeTrace()
+    
+    if pool is not None:
+        start = time.monotonic()
+        with pool.driver(timeout) as driver:
+            trace.observe('driver_startup', time.monotonic() - start, source='pool')
+            yield driver
+        return
+
+    with trace.span('driver_startup', source='new'):
+        driver = setup_driver()
+    try:
+        yield driver
+    finally:
+        quit_driver(driver)
+
+@contextmanager
+def borrow_drivers(pool=None, count=1, trace=None):
     """
-    Main function to scrape all reviews from a Booking.com property.
+    Yield a list of up to `count` drivers for one scrape.
+    
+    The first driver is waited for; from a pool, the others are only taken if
+    a session is free right away, so parallel scrapes never wait on each other
+    while holding a session.
+    """
+    with ExitStack() as stack:
+        drivers = [stack.enter_context(borrow_driver(pool, trace))]
+        for _ in range(count - 1):
+            try:
+                drivers.append(stack.enter_context(borrow_driver(pool, trace, timeout=0 if pool else None)))
+            except TimeoutError:
+                break
+        
+        if len(drivers) < count:
+            logger.info(f"Using {len(drivers)} of {count} requested browser sessions")
+        yield drivers
+
+def get_csv_filename(url):
+    """Return the CSV file a property's reviews are saved to."""
+    property_name = url.split('/')[-1].split('.')[0]
+    return f"booking_reviews_{property_name}.csv"
+
+def load_known_fingerprints(csv_filename):
+    """Load a property's saved reviews and return (DataFrame, set of review fingerprints)."""
+    import pandas as pd
+    
+    if not os.path.exists(csv_filename):
+        return pd.DataFrame(columns=OUTPUT_COLUMNS), set()
+    
+    existing = pd.read_csv(csv_filename, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+    fingerprints = {review_fingerprint(row) for row in existing.to_dict(orient='records')}
+    return existing, fingerprints
+
+def drop_known_reviews(page_reviews, known_fingerprints):
+    """
+    Remove reviews that are already stored.
+    
+    Returns:
+        tuple: (new reviews, True if every review on the page was already known)
+    """
+    new_reviews = [review for review in page_reviews
+                   if review_fingerprint(review) not in known_fingerprints]
+    return new_reviews, bool(page_reviews) and not new_reviews
+
+def iter_pages_http(url, max_reviews, fetcher, progress=None, known_fingerprints=None, checkpoint=None,
+                    trace=None):
+    """
+    Yield each page of reviews from the paginated review list, fetched over plain HTTP.
     
     Args:
         url (str): URL of the Booking.com property
-        max_reviews (int, optional): Maximum number of reviews to scrape. 
-                                    If None, scrape all reviews.
+        max_reviews (int, optional): Maximum number of reviews to scrape
+        fetcher: Backend with a `rows` attribute and a `fetch_pages(url, page_indexes)`
+                 method yielding (page_index, html), such as HttpFetcher
+        progress (callable, optional): Called as progress(pages_done, reviews_so_far)
+                                       after every page
+        known_fingerprints (set, optional): Fingerprints of stored reviews. Only
+                                            new reviews are yielded, and
+                                            pagination stops at the first page
+                                            with no new reviews.
+        checkpoint (Checkpoint, optional): Resume after the pages it has recorded
+        trace (ScrapeTrace, optional): Collects fetch and parse timings
     
-    Returns:
-        DataFrame: Pandas DataFrame containing all scraped reviews
+    Yields:
+        list: Review dicts for one page. Nothing is yielded if the first page
+              had no review cards, so the caller can fall back to Selenium.
     """
-    all_reviews = []
-    driver = None
+    from scrapers.parser import parse_reviews, find_page_problem
     
-    try:
-        # Set up the WebDriver
-        driver = setup_driver()
+    trace = trace or ScrapeTrace()
+    throttle = getattr(fetcher, 'throttle', None) or AdaptiveThrottle()
+    scraped = checkpoint.reviews_written if checkpoint else 0
+    rows = fetcher.rows
+    batch_size = getattr(fetcher, 'max_concurrency', 1)
+    page_index = checkpoint.pages_done if checkpoint else 0
+    
+    def page_problem_http(idx, html):
+        if not html:
+            return 'error'
+        problem = find_page_problem(html, REVIEW_LIST_SELECTOR)
+        # The browser gets past bot checks more often, so the first page falls back to it
+        if problem == 'challenge' and idx == 0:
+            return None
+        return problem
+    
+    while True:
+        # Only request as many pages as max_reviews can still use
+        batch = batch_size
+        if max_reviews:
+            batch = min(batch, -(-(max_reviews - scraped) // rows))
         
-        # Navigate to the reviews tab
-        if '#tab-reviews' not in url:
-            reviews_url = f"{url}#tab-reviews"
-        else:
-            reviews_url = url
+        fetch_start = time.monotonic()
+        for idx, html in fetcher.fetch_pages(url, range(page_index, page_index + batch)):
+            # Pages arrive in order, so this is the wait for this page after the previous one
+            trace.observe('http_fetch', time.monotonic() - fetch_start)
+            with trace.span('http_parse'):
+                page_reviews = parse_reviews(html, trace) if html else []
             
-        driver.get(reviews_url)
-        time.sleep(10)  # Allow page to load
+            # Fetch a failed or degraded page again; a plain empty list is past the end
+            for attempt in range(throttle.retries):
+                problem = None if page_reviews else page_problem_http(idx, html)
+                if problem is None:
+                    break
+                if html:
+                    # Failed requests are already recorded by the fetcher
+                    throttle.record(ok=False)
+                trace.inc('degraded_pages', reason=problem, backend='http')
+                trace.inc('page_retries', backend='http')
+                trace.observe('backoff', throttle.backoff(attempt))
+                logger.info(f"Review page {idx + 1} looked degraded ({problem}), fetching it again")
+                _, html = next(iter(fetcher.fetch_pages(url, [idx])))
+                with trace.span('http_parse'):
+                    page_reviews = parse_reviews(html, trace) if html else []
+            
+            # Still degraded after every retry, so this is not the end of the reviews
+            if not page_reviews and idx > 0 and page_problem_http(idx, html):
+                logger.warning(f"Review page {idx + 1} still degraded after {throttle.retries} retries")
+                trace.inc('abandoned_pages', backend='http')
+            
+            if idx == 0 and not page_reviews:
+                logger.info("HTTP fetch returned no review cards")
+                return
+            
+            page_size = len(page_reviews)
+            if known_fingerprints is not None:
+                page_reviews, page_known = drop_known_reviews(page_reviews, known_fingerprints)
+                if page_known:
+                    logger.info(f"Page {idx + 1} only has reviews already stored, stopping")
+                    # An empty first page still tells the caller the backend worked
+                    if idx == 0:
+                        yield []
+                    return
+            
+            if max_reviews:
+                page_reviews = page_reviews[:max_reviews - scraped]
+            scraped += len(page_reviews)
+            logger.info(f"Fetched {len(page_reviews)} reviews from page {idx + 1} over HTTP")
+            trace.inc('pages', backend='http')
+            trace.inc('reviews_scraped', len(page_reviews), backend='http')
+            yield page_reviews
+            if progress:
+                progress(idx + 1, scraped)
+            
+            # A short page is the last one
+            if page_size < rows:
+                trace.reached_end = True
+                return
+            if max_reviews and scraped >= max_reviews:
+                return
+            fetch_start = time.monotonic()
+        
+        page_index += batch
+
+def iter_pages_selenium(url, max_reviews, driver, budget, extraction='js', progress=None,
+                        known_fingerprints=None, checkpoint=None, trace=None):
+    """
+    Yield each page of reviews by rendering the property page and clicking through pagination.
+    
+    A page without reviews while more are due, or a full page without a way
+    to the next one, is retried after a backoff, paced by the session's
+    AdaptiveThrottle.
+    """
+    from selenium.webdriver.common.by import By
+    
+    trace = trace or ScrapeTrace()
+    throttle = throttle_for(driver)
+    scraped = checkpoint.reviews_written if checkpoint else 0
+    
+    # Navigate to the reviews tab
+    if '#tab-reviews' not in url:
+        reviews_url = f"{url}#tab-reviews"
+    else:
+        reviews_url = url
+    
+    def open_reviews():
+        throttle.wait()
+        start = time.monotonic()
+        with trace.span('page_load'):
+            driver.get(reviews_url)
+            wait_for_document_ready(driver, budget)
+        throttle.record(time.monotonic() - start)
         
         # Try to handle cookie consent if present
-        try:
-            cookie_buttons = driver.find_elements(By.XPATH, 
-                                                "//button[contains(text(), 'Accept') or contains(@id, 'accept')]")
-            for button in cookie_buttons:
-                if button.is_displayed():
-                    driver.execute_script("arguments[0].click();", button)
-                    time.sleep(2)
-                    break
-        except:
-            pass
+        with trace.span('cookie_consent'):
+            accept_cookies(driver)
         
         # Ensure we're in the reviews tab
         try:
@@ -377,82 +461,540 @@ def scrape_booking_reviews(url, max_reviews=None):
             for tab in review_tabs:
                 if tab.is_displayed():
                     driver.execute_script("arguments[0].click();", tab)
-                    time.sleep(5)
                     break
         except:
             pass
+    
+    def next_page():
+        throttle.wait()
+        start = time.monotonic()
+        with trace.span('next_page'):
+            moved = go_to_next_page(driver, budget)
+        if moved:
+            throttle.record(time.monotonic() - start)
+        return moved
+    
+    def retry_later(attempt, problem):
+        throttle.record(ok=False)
+        trace.inc('degraded_pages', reason=problem, backend='selenium')
+        trace.inc('page_retries', backend='selenium')
+        trace.observe('backoff', throttle.backoff(attempt))
+        logger.info(f"Page {page_num} looked degraded ({problem}), retrying")
+    
+    open_reviews()
+    
+    # Get the review count, unless a checkpoint already recorded it
+    if checkpoint is not None and checkpoint.total_reviews is not None:
+        total_reviews = checkpoint.total_reviews
+    else:
+        with trace.span('review_count'):
+            total_reviews = get_review_count(driver, url, budget)
+        if checkpoint is not None:
+            checkpoint.total_reviews = total_reviews
+    logger.info(f"Found {total_reviews} total reviews")
+    
+    # Determine how many reviews to scrape
+    reviews_to_scrape = min(total_reviews, max_reviews) if max_reviews else total_reviews
+    logger.info(f"Will scrape up to {reviews_to_scrape} reviews")
+    
+    # Scrape all pages until we have enough reviews or reach the end
+    page_num = 1
+    full_page = 0
+    
+    # Skip the pages an interrupted run already wrote
+    if checkpoint is not None and checkpoint.resuming:
+        logger.info(f"Skipping {checkpoint.pages_done} pages already scraped")
+        while page_num <= checkpoint.pages_done:
+            if not next_page():
+                logger.info("No more pages available")
+                return
+            page_num += 1
+    
+    while scraped < reviews_to_scrape:
+        logger.info(f"Scraping page {page_num}...")
+        budget.page = page_num
         
-        # Get the review count
-        total_reviews = get_review_count(driver, url)
-        logger.info(f"Found {total_reviews} total reviews")
+        # Scrape reviews from current page
+        with trace.span('scrape_page', mode=extraction):
+            page_reviews = scrape_reviews_from_page(driver, budget, extraction, trace)
         
-        # Determine how many reviews to scrape
-        reviews_to_scrape = min(total_reviews, max_reviews) if max_reviews else total_reviews
-        logger.info(f"Will scrape up to {reviews_to_scrape} reviews")
+        # More reviews are due, so a page without any was not served properly
+        for attempt in range(throttle.retries):
+            if page_reviews:
+                break
+            problem = page_problem(driver) or 'no_cards'
+            retry_later(attempt, problem)
+            if problem == 'consent':
+                accept_cookies(driver)
+            else:
+                # Load the property again and click through to the same page
+                open_reviews()
+                if not all(next_page() for _ in range(page_num - 1)):
+                    continue
+            with trace.span('scrape_page', mode=extraction):
+                page_reviews = scrape_reviews_from_page(driver, budget, extraction, trace)
+        if not page_reviews:
+            logger.warning(f"Page {page_num} still had no reviews after {throttle.retries} retries")
+            trace.inc('abandoned_pages', backend='selenium')
+        page_size = len(page_reviews)
+        full_page = max(full_page, page_size)
         
-        # Scrape all pages until we have enough reviews or reach the end
-        page_num = 1
+        # In incremental mode a page of already stored reviews means the rest are stored too
+        if known_fingerprints is not None:
+            page_reviews, page_known = drop_known_reviews(page_reviews, known_fingerprints)
+            if page_known:
+                logger.info(f"Page {page_num} only has reviews already stored, stopping")
+                break
         
-        while len(all_reviews) < reviews_to_scrape:
-            logger.info(f"Scraping page {page_num}...")
-            
-            # Scrape reviews from current page
-            page_reviews = scrape_reviews_from_page(driver)
-            all_reviews.extend(page_reviews)
-            
-            logger.info(f"Scraped {len(page_reviews)} reviews from page {page_num}")
-            logger.info(f"Total reviews scraped so far: {len(all_reviews)}")
+        scraped += len(page_reviews)
+        
+        logger.info(f"Scraped {len(page_reviews)} reviews from page {page_num}")
+        logger.info(f"Total reviews scraped so far: {scraped}")
+        trace.inc('pages', backend='selenium')
+        trace.inc('reviews_scraped', len(page_reviews), backend='selenium')
+        yield page_reviews
+        if progress:
+            progress(page_num, scraped)
+        
+        # Check if we need more reviews
+        if scraped >= reviews_to_scrape:
+            logger.info(f"Reached target of {reviews_to_scrape} reviews")
+            if reviews_to_scrape == total_reviews:
+                # The total may come from the review count cache, so only the pagination shows
+                # whether this was the last page: a short page, or no page after it
+                trace.reached_end = 0 < page_size < full_page or not next_page()
+            break
             
-            # Check if we need more reviews
-            if len(all_reviews) >= reviews_to_scrape:
-                logger.info(f"Reached target of {reviews_to_scrape} reviews")
+        # Try to go to next page. Only a full page can be missing its pagination.
+        moved = next_page()
+        for attempt in range(throttle.retries):
+            if moved or not page_size or page_size < full_page:
                 break
+            retry_later(attempt, 'no_pagination')
+            moved = next_page()
+        if not moved:
+            logger.info("No more pages available")
+            if page_size and page_size >= full_page:
+                trace.inc('abandoned_pages', backend='selenium')
+            else:
+                trace.reached_end = True
+            break
+            
+        page_num += 1
+    
+    logger.info(f"Spent {budget.total():.2f}s waiting: {budget.summary()}")
+    trace.waits = budget.summary()
+
+def page_problem(driver, list_selector=None):
+    """Return why the current page without review cards looks degraded, or None, see PAGE_PROBLEM_JS."""
+    try:
+        return driver.execute_script(PAGE_PROBLEM_JS, CHALLENGE_SELECTORS, CHALLENGE_PATTERNS,
+                                     CONSENT_SELECTORS, list_selector)
+    except Exception as e:
+        logger.warning(f"Could not check the page for problems: {e}")
+        return None
+
+def accept_cookies(driver):
+    """Click the cookie consent button if one is shown."""
+    from selenium.webdriver.common.by import By
+    
+    try:
+        cookie_buttons = driver.find_elements(By.XPATH, 
+                                            "//button[contains(text(), 'Accept') or contains(@id, 'accept')]")
+        for button in cookie_buttons:
+            if button.is_displayed():
+                driver.execute_script("arguments[0].click();", button)
+                return True
+    except:
+        pass
+    return False
+
+def load_review_list_page(driver, url, offset, rows, budget, extraction='js', trace=None):
+    """
+    Open the review list page starting at review `offset` and extract its reviews.
+    
+    A page without cards that shows a bot check or consent wall, or no review
+    list at all, is loaded again after a backoff, paced by the session's
+    AdaptiveThrottle.
+    
+    Returns:
+        list: Review dicts, empty once `offset` is past the last review or
+              the page stayed degraded after every retry
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import WebDriverException
+    
+    trace = trace or ScrapeTrace()
+    throttle = throttle_for(driver)
+    
+    for attempt in range(throttle.retries + 1):
+        throttle.wait()
+        start = time.monotonic()
+        try:
+            with trace.span('review_list_load'):
+                driver.get(build_review_list_url(url, offset=offset, rows=rows))
+                wait_for_document_ready(driver, budget)
+            has_cards = bool(driver.find_elements(By.CSS_SELECTOR, REVIEW_CARD_SELECTOR))
+            # The review list is rendered on the server, so a plain page without cards is past the end
+            problem = None if has_cards else page_problem(driver, REVIEW_LIST_SELECTOR)
+        except WebDriverException as e:
+            has_cards, problem, error = False, 'error', e
+            logger.warning(f"Loading reviews from offset {offset} failed: {e.msg}")
+        
+        throttle.record(time.monotonic() - start, ok=problem is None)
+        if has_cards:
+            with trace.span('scrape_page', mode=extraction):
+                return scrape_reviews_from_page(driver, budget, extraction, trace)
+        if problem is None:
+            return []
+        
+        trace.inc('degraded_pages', reason=problem, backend='selenium')
+        if attempt == throttle.retries:
+            break
+        if problem == 'consent':
+            accept_cookies(driver)
+        trace.inc('page_retries', backend='selenium')
+        trace.observe('backoff', throttle.backoff(attempt))
+        logger.info(f"Review list page at offset {offset} looked degraded ({problem}), retrying")
+    
+    # A session that keeps failing is handed back to the pool as crashed
+    if problem == 'error':
+        raise error
+    logger.warning(f"Review list page at offset {offset} still degraded ({problem}) "
+                   f"after {throttle.retries} retries")
+    trace.inc('abandoned_pages', backend='selenium')
+    return []
+
+def iter_pages_direct(url, max_reviews, drivers, budgets, extraction='js', progress=None,
+                      known_fingerprints=None, checkpoint=None, trace=None, rows=REVIEWS_PER_PAGE,
+                      start_offset=0):
+    """
+    Yield each page of reviews by opening review list pages by offset in the browser.
+    
+    Unlike clicking through pagination, any page can be opened directly: only
+    the pages max_reviews needs are loaded, a checkpoint resumes at its offset,
+    and with several drivers a batch of pages loads in parallel, one per
+    driver. Pages are always yielded in order.
+    
+    Args:
+        drivers (list): Browser sessions to load pages with
+        budgets (list): One WaitBudget per driver
+        rows (int): Reviews per review list page
+        start_offset (int): Offset of the first review to load, for scraping
+                            a range of reviews; max_reviews counts from here
+        Other arguments as for iter_pages_http.
+    
+    Yields:
+        list: Review dicts for one page. Nothing is yielded if the first page
+              had no review cards, so the caller can click through instead.
+    """
+    trace = trace or ScrapeTrace()
+    scraped = checkpoint.reviews_written if checkpoint else 0
+    pages_done = checkpoint.pages_done if checkpoint else 0
+    # Continuing from the reviews written also resumes checkpoints of the HTTP backend
+    offset = start_offset + scraped
+    first_offset = offset
+    
+    try:
+        with ThreadPoolExecutor(max_workers=len(drivers), thread_name_prefix="review-page") as executor:
+            while True:
+                # Only load as many pages as max_reviews can still use
+                batch = len(drivers)
+                if max_reviews:
+                    batch = min(batch, -(-(max_reviews - scraped) // rows))
                 
-            # Try to go to next page
-            if not go_to_next_page(driver):
-                logger.info("No more pages available")
-                break
+                futures = [(offset + i * rows,
+                            executor.submit(load_review_list_page, drivers[i], url, offset + i * rows, rows,
+                                            budgets[i], extraction, trace))
+                           for i in range(batch)]
                 
-            page_num += 1
-            
-        # Create DataFrame from collected reviews
-        if all_reviews:
-            df = pd.DataFrame(all_reviews)
-            
-            # Add ID column
-            df.insert(0, 'id', range(1, len(df) + 1))
-            
-            # Select and order columns as requested - removing pros and cons columns
-            columns = [
-                'id', 'reviewer_name', 'reviewer_country', 'stay_date', 'review_type', 
-                'review_date', 'room_type', 'nights_stayed', 'rating', 'review_title',
-                'review_text'
-            ]
-            
-            # Make sure all required columns exist
-            for col in columns:
-                if col not in df.columns and col != 'id':
-                    df[col] = ""
+                for page_offset, future in futures:
+                    page_reviews = future.result()
+                    
+                    if page_offset == first_offset and not page_reviews:
+                        logger.info("Review list page had no review cards")
+                        return
+                    
+                    page_size = len(page_reviews)
+                    if known_fingerprints is not None:
+                        page_reviews, page_known = drop_known_reviews(page_reviews, known_fingerprints)
+                        if page_known:
+                            logger.info(f"Reviews from offset {page_offset} are already stored, stopping")
+                            # An empty first page still tells the caller the navigation worked
+                            if page_offset == first_offset:
+                                yield []
+                            return
+                    
+                    if max_reviews:
+                        page_reviews = page_reviews[:max_reviews - scraped]
+                    scraped += len(page_reviews)
+                    pages_done += 1
+                    logger.info(f"Scraped {len(page_reviews)} reviews from offset {page_offset}")
+                    trace.inc('pages', backend='selenium')
+                    trace.inc('reviews_scraped', len(page_reviews), backend='selenium')
+                    yield page_reviews
+                    if progress:
+                        progress(pages_done, scraped)
+                    
+                    # A short page is the last one
+                    if page_size < rows:
+                        trace.reached_end = True
+                        return
+                    if max_reviews and scraped >= max_reviews:
+                        return
+                
+                offset += batch * rows
+    finally:
+        merged = WaitBudget()
+        for budget in budgets:
+            merged.timings.extend(budget.timings)
+        trace.waits = merged.summary()
+
+def iter_review_pages(url, max_reviews=None, pool=None, page_timeout=15, extraction='js', fetcher=None,
+                      progress=None, known_fingerprints=None, checkpoint=None, trace=None,
+                      navigation='direct', sessions=1):
+    """
+    Yield the reviews of a Booking.com property one page at a time.
+    
+    Takes the same scrape options as scrape_booking_reviews. The HTTP backend
+    is tried first when `fetcher` is given; Selenium is used if it yields no
+    pages. Pooled browser sessions are held until the generator finishes or
+    is closed. A resumed `checkpoint` continues with the backend that wrote it.
+    
+    Yields:
+        list: Review dicts for one page
+    """
+    trace = trace or ScrapeTrace()
+    resuming = checkpoint is not None and checkpoint.resuming
+    resumed_backend = checkpoint.backend if resuming else None
+    
+    if fetcher is not None and resumed_backend not in ('selenium', 'selenium-direct'):
+        pages = iter_pages_http(url, max_reviews, fetcher, progress, known_fingerprints, checkpoint, trace)
+        first_page = next(pages, None)
+        if first_page is not None:
+            if checkpoint is not None:
+                checkpoint.backend = 'http'
+            yield first_page
+            yield from pages
+            return
+        
+        # The HTTP backend found the review list, so the browser would find no more pages
+        if resuming:
+            logger.info("No more review pages over HTTP")
+            return
+        logger.info("Falling back to Selenium")
+    
+    # Pages are numbered differently when clicking through, so a resumed scrape keeps its navigation
+    if resumed_backend == 'selenium':
+        navigation = 'click'
+    elif resuming:
+        navigation = 'direct'
+    
+    with borrow_drivers(pool, sessions if navigation == 'direct' else 1, trace) as drivers:
+        if navigation == 'direct':
+            # Review list pages arrive fully rendered, so the card count needs no settling time
+            budgets = [WaitBudget(page_timeout=page_timeout, stable_for=0) for _ in drivers]
+            pages = iter_pages_direct(url, max_reviews, drivers, budgets, extraction, progress,
+                                      known_fingerprints, checkpoint, trace)
+            first_page = next(pages, None)
+            if first_page is not None:
+                if checkpoint is not None:
+                    checkpoint.backend = 'selenium-direct'
+                yield first_page
+                yield from pages
+                return
             
-            df = df[columns]
+            if resuming:
+                logger.info("No more review list pages")
+                return
+            logger.info("Falling back to clicking through pagination")
+        
+        if checkpoint is not None:
+            checkpoint.backend = 'selenium'
+        
+        budget = WaitBudget(page_timeout=page_timeout)
+        yield from iter_pages_selenium(url, max_reviews, drivers[0], budget, extraction, progress,
+                                       known_fingerprints, checkpoint, trace)
+
+def to_output_record(review, review_id):
+    """Return a review as an output row with the standard columns."""
+    record = {col: review.get(col, "") for col in OUTPUT_COLUMNS}
+    record['id'] = review_id
+    return record
+
+def scrape_to_sinks(url, sinks, max_reviews=None, start_id=1, checkpoint=None, normalize=True, **scrape_kwargs):
+    """
+    Stream a property's reviews into sinks page by page, without building a DataFrame.
+    
+    Args:
+        url (str): URL of the Booking.com property
+        sinks (list): Objects with write(records) and close(), such as CsvSink,
+                      JsonLinesSink or MemorySink. Each receives every page
+                      of output rows as soon as it is scraped.
+        max_reviews (int, optional): Maximum number of reviews to scrape
+        start_id (int): id assigned to the first review
+        checkpoint (Checkpoint, optional): Saved after every page and cleared
+                                           when the scrape completes. A
+                                           resumed checkpoint overrides start_id.
+        normalize (bool): Convert ratings, dates and nights to typed values
+                          before writing, see normalize_reviews.
+        **scrape_kwargs: Passed to iter_review_pages
+    
+    Returns:
+        int: Number of reviews written by this run
+    """
+    if checkpoint is not None and checkpoint.resuming:
+        start_id = checkpoint.next_id
+    next_id = start_id
+    
+    try:
+        for page_reviews in iter_review_pages(url, max_reviews, checkpoint=checkpoint, **scrape_kwargs):
+            records = [to_output_record(review, next_id + i) for i, review in enumerate(page_reviews)]
+            if normalize:
+                records = normalize_records(records, OUTPUT_COLUMNS)
+            next_id += len(records)
+            if checkpoint is not None:
+                checkpoint.begin_page()
+            for sink in sinks:
+                sink.write(records)
             
-            # Save to CSV
-            property_name = url.split('/')[-1].split('.')[0]
-            csv_filename = f"booking_reviews_{property_name}.csv"
-            df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
+            # Only record the page once every sink has it
+            if checkpoint is not None:
+                files = {sink.path: sink.tell() for sink in sinks if hasattr(sink, 'tell')}
+                checkpoint.record_page(len(records), next_id, files)
+    finally:
+        for sink in sinks:
+            sink.close()
+    
+    if checkpoint is not None:
+        checkpoint.clear()
+    
+    return next_id - start_id
+
+def scrape_booking_reviews(url, max_reviews=None, pool=None, page_timeout=15, extraction='js', fetcher=None,
+                           progress=None, incremental=False, resume=True, store=None, normalize=True,
+                           trace=None, navigation='direct', sessions=1, search_index=None):
+    """
+    Main function to scrape all reviews from a Booking.com property.
+    
+    Reviews are appended to the property's CSV page by page as they are scraped
+    and collected into a DataFrame. Use scrape_to_sinks to stream them without
+    building a DataFrame.
+    
+    Args:
+        url (str): URL of the Booking.com property
+        max_reviews (int, optional): Maximum number of reviews to scrape. 
+                                    If None, scrape all reviews.
+        pool (DriverPool, optional): Pool to borrow a browser session from.
+                                     If None, a dedicated browser is started
+                                     and quit when the scrape finishes.
+        page_timeout (float): Maximum seconds to wait for any single page
+                              load or pagination step.
+        extraction (str): Review extraction mode passed to
+                          scrape_reviews_from_page ('js', 'html' or 'element').
+        fetcher (HttpFetcher, optional): Browserless backend to try first.
+                                         Selenium is used if it finds no reviews.
+        progress (callable, optional): Called as progress(pages_done, reviews_so_far)
+                                       after every scraped page.
+        incremental (bool): Load the property's existing CSV, stop at the first
+                            page with no new reviews and append only new rows.
+                            max_reviews then limits the number of new reviews.
+        resume (bool): Checkpoint a full scrape after every page and, if an
+                       earlier identical scrape was interrupted, continue
+                       from its last checkpoint. Not used in incremental mode,
+                       where rerunning already skips stored reviews.
+        store (ReviewStore, optional): Also upsert every page into this
+                                       typed, indexed store.
+        normalize (bool): Return and save typed columns: float ratings,
+                          datetime dates, integer nights and separate
+                          review_pros/review_cons. If False, keep raw text.
+        trace (ScrapeTrace, optional): Collects per-stage timings and
+                                       selector counters for this scrape.
+        navigation (str): 'direct' to open review list pages by offset,
+                          loading only the pages needed, or 'click' to
+                          click through the property page's pagination.
+                          'direct' falls back to 'click' if the review
+                          list shows no reviews.
+        sessions (int): Browser sessions used to load review list pages in
+                        parallel with 'direct' navigation. Extra sessions
+                        are only taken from the pool if they are idle.
+        search_index (SearchIndex, optional): Also add every page to this
+                                              cross-property search index.
+    
+    Returns:
+        DataFrame: Pandas DataFrame containing all scraped reviews. In
+                   incremental mode this includes the previously stored ones.
+                   attrs['complete'] is True if the scrape reached the
+                   property's last review page without giving up on a
+                   degraded page.
+    """
+    # pandas is only imported once the first scrape needs it
+    import pandas as pd
+    
+    csv_filename = get_csv_filename(url)
+    trace = trace or ScrapeTrace()
+    start = time.monotonic()
+    
+    try:
+        existing, known_fingerprints, start_id = None, None, 1
+        if incremental:
+            existing, known_fingerprints = load_known_fingerprints(csv_filename)
+            logger.info(f"Loaded {len(existing)} stored reviews from {csv_filename}")
             
-            logger.info(f"Saved {len(df)} reviews to {csv_filename}")
+            # Continue numbering after the stored reviews
+            ids = pd.to_numeric(existing['id'], errors='coerce')
+            start_id = int(ids.max()) + 1 if ids.notna().any() else 1
+        
+        checkpoint, resumed = None, False
+        if resume and not incremental:
+            checkpoint = Checkpoint.for_scrape(url, max_reviews)
+            resumed = checkpoint.resuming
+            if resumed:
+                logger.info(f"Resuming {url} after page {checkpoint.pages_done} "
+                            f"({checkpoint.reviews_written} reviews already saved)")
+                checkpoint.restore_files()
+        
+        collector = MemorySink()
+        sinks = [CsvSink(csv_filename, append=incremental or resumed), collector]
+        if store is not None:
+            sinks.append(SqliteSink(store, url))
+        if search_index is not None:
+            sinks.append(SearchSink(search_index, url))
+        
+        scrape_to_sinks(
+            url, sinks, max_reviews, start_id,
+            checkpoint=checkpoint, normalize=normalize, pool=pool, page_timeout=page_timeout,
+            extraction=extraction, fetcher=fetcher, progress=progress, known_fingerprints=known_fingerprints,
+            trace=trace, navigation=navigation, sessions=sessions
+        )
+        
+        df = None
+        if resumed:
+            # The rows saved before the interruption are only in the CSV
+            df = pd.read_csv(csv_filename, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+            df['id'] = df['id'].astype(int)
+        elif incremental:
+            logger.info(f"Appended {collector.rows_written} new reviews to {csv_filename}")
+            df = pd.concat([existing, collector.to_frame()], ignore_index=True)
+        elif collector.records:
+            # Create DataFrame from collected reviews
+            df = collector.to_frame()
+        
+        trace.inc('scrapes', status='ok')
+        if df is not None and not df.empty:
+            df = normalize_reviews(df) if normalize else df
+            # Lets a cache tell the property's full set of reviews apart from a scrape that stopped early
+            df.attrs['complete'] = trace.complete
             return df
-            
         else:
             logger.warning("No reviews were scraped")
             return pd.DataFrame()
             
     except Exception as e:
         logger.error(f"Error in scrape_booking_reviews: {e}")
+        trace.inc('scrapes', status='error')
+        if resume and not incremental:
+            logger.info(f"Reviews scraped so far are kept in {csv_filename}; rerun to resume")
         return pd.DataFrame()
-        
     finally:
-        # Clean up
-        if driver:
-            driver.quit()
\ No newline at end of file
+        trace.observe('scrape', time.monotonic() - start)
@@ -0,0 +1,211 @@
+# scrapers/cache.py
+import os
+import time
+import pickle
+import threading
+import logging
+from collections import OrderedDict
+from scrapers.utils import property_key
+
+logger = logging.getLogger(__name__)
+
+class ResultCache:
+    """
+    Cache of scrape results keyed by property, with a TTL and LRU eviction.
+
+    One entry is kept per property: the largest result scraped within the
+    TTL. A request for fewer reviews is answered with a prefix of it. An
+    optional on-disk tier keeps results across restarts and after they are
+    evicted from memory.
+
+    Args:
+        ttl (float): Seconds a result stays valid
+        max_entries (int): Properties kept in memory before the least recently
+                           used one is evicted
+        disk_dir (str, optional): Directory for the on-disk tier
+    """
+
+    def __init__(self, ttl=900, max_entries=64, disk_dir=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    @staticmethod
+    def _covers(entry, max_reviews):
+        """True if a cached entry holds at least the first `max_reviews` reviews."""
+        if entry['max_reviews'] is None:
+            return True
+        return max_reviews is not None and max_reviews <= entry['max_reviews']
+
+    def _fresh(self, entry):
+        return time.time() - entry['stored_at'] < self.ttl
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, key.replace('/', '__') + ".pkl")
+
+    def get(self, url, max_reviews=None):
+        """
+        Return the cached reviews of a property, or None on a miss.
+
+        Args:
+            url (str): URL of the Booking.com property
+            max_reviews (int, optional): Reviews requested; None or 0 means all
+
+        Returns:
+            DataFrame: The first `max_reviews` cached reviews, or None
+        """
+        # The scraper also treats 0 as no limit, so only a complete entry may answer it
+        max_reviews = max_reviews or None
+        key = property_key(url)
+        if key is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._fresh(entry):
+                del self._entries[key]
+                entry = None
+
+            from_disk = False
+            if entry is None and self.disk_dir:
+                entry = self._load_from_disk(key)
+                from_disk = entry is not None
+
+            if entry is None or not self._covers(entry, max_reviews):
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            if from_disk:
+                self.disk_hits += 1
+                self._remember(key, entry)
+            else:
+                self._entries.move_to_end(key)
+
+        df = entry['df']
+        return df.head(max_reviews).copy() if max_reviews else df.copy()
+
+    def put(self, url, max_reviews, df, complete=False):
+        """
+        Cache a scrape result unless a fresh, larger one is already cached.
+
+        Args:
+            url (str): URL of the Booking.com property
+            max_reviews (int, optional): Reviews the scrape was asked for
+            df (DataFrame): The scraped reviews
+            complete (bool): The scraper reached the property's last review
+                             page cleanly, so `df` holds all its reviews and
+                             answers requests for any number of them. A
+                             short result is not enough: pagination also
+                             stops early on pages that stay degraded.
+        """
+        key = property_key(url)
+        if key is None or df is None or df.empty:
+            return
+
+        # Otherwise the result only covers the reviews it actually holds
+        max_reviews = None if complete else min(len(df), max_reviews or len(df))
+
+        entry = {'df': df.copy(), 'max_reviews': max_reviews, 'stored_at': time.time()}
+
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None and self._fresh(current) and self._covers(current, max_reviews) \
+                    and not self._covers(entry, current['max_reviews']):
+                return
+            self._remember(key, entry)
+
+        if self.disk_dir:
+            self._save_to_disk(key, entry)
+
+    def invalidate(self, url):
+        """Drop a property from both tiers, e.g. after it was refreshed incrementally."""
+        key = property_key(url)
+        if key is None:
+            return
+
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.disk_dir and os.path.exists(self._disk_path(key)):
+            os.remove(self._disk_path(key))
+
+    def get_or_scrape(self, url, max_reviews, scrape, incremental=False):
+        """
+        Answer from the cache, or call `scrape()` and cache its result.
+
+        Incremental scrapes always run, since they exist to pick up new
+        reviews, and drop the property's cached result afterwards.
+        """
+        if incremental:
+            df = scrape()
+            self.invalidate(url)
+            return df
+
+        df = self.get(url, max_reviews)
+        if df is not None:
+            logger.info(f"Serving {len(df)} cached reviews for {property_key(url)}")
+            return df
+
+        df = scrape()
+        if df is not None:
+            self.put(url, max_reviews, df, complete=df.attrs.get('complete', False))
+        return df
+
+    def _remember(self, key, entry):
+        """Store an entry as most recently used, evicting the LRU entry if full. Caller holds the lock."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _load_from_disk(self, key):
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+            return None
+
+        if not self._fresh(entry):
+            os.remove(path)
+            return None
+        return entry
+
+    def _save_to_disk(self, key, entry):
+        path = self._disk_path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(entry, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write cache file {path}: {e}")
+
+    def stats(self):
+        """Return hit/miss counters and the current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl
+            }
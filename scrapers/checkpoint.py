@@ -0,0 +1,171 @@
+# scrapers/checkpoint.py
+import os
+import json
+import time
+import logging
+from scrapers.utils import extract_property_info
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_DIR = "checkpoints"
+
+# Older checkpoints are not resumed: new reviews shift every offset the scrape recorded
+CHECKPOINT_MAX_AGE = 24 * 3600
+
+def _file_state(path):
+    """Return (size, mtime_ns) of a file, or (None, None) if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None, None
+    return stat.st_size, stat.st_mtime_ns
+
+class Checkpoint:
+    """
+    Durable progress of a property scrape, saved after every page.
+
+    Records the last page written, how many reviews and which id come next,
+    the total review count and the size and modification time of every
+    output file at that point, so an interrupted scrape can resume exactly
+    where it stopped. A page being written is marked as pending, which tells
+    a partial page of this scrape apart from rows another run added later.
+
+    Args:
+        path (str): JSON file the checkpoint is saved to
+        url (str): URL of the Booking.com property
+        max_reviews (int, optional): max_reviews of the scrape being checkpointed
+    """
+
+    def __init__(self, path, url, max_reviews=None):
+        self.path = path
+        self.url = url
+        self.max_reviews = max_reviews
+        self.backend = None
+        self.pages_done = 0
+        self.reviews_written = 0
+        self.next_id = 1
+        self.total_reviews = None
+        self.files = {}
+        self.saved_at = None
+        self.pending = False
+
+    @classmethod
+    def for_scrape(cls, url, max_reviews=None, checkpoint_dir=CHECKPOINT_DIR, max_age=CHECKPOINT_MAX_AGE):
+        """
+        Load the saved checkpoint of an identical scrape, or start a fresh one.
+
+        Each property and max_reviews has its own checkpoint, so concurrent
+        scrapes with different limits do not discard each other's. A
+        checkpoint older than `max_age` seconds, or whose output files have
+        changed since it was saved, is discarded.
+        """
+        property_type, country_code, property_name = extract_property_info(url)
+        name = property_name or url.split('/')[-1].split('.')[0]
+        limit = 'all' if max_reviews is None else max_reviews
+        path = os.path.join(checkpoint_dir, f"{country_code or 'xx'}_{name}_{limit}.json")
+        checkpoint = cls(path, url, max_reviews)
+
+        if not os.path.exists(path):
+            return checkpoint
+
+        try:
+            with open(path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return checkpoint
+
+        if state.get('max_reviews') != max_reviews:
+            logger.info(f"Discarding checkpoint {path} saved for max_reviews={state.get('max_reviews')}")
+            checkpoint.clear()
+            return checkpoint
+
+        for key in ('backend', 'pages_done', 'reviews_written', 'next_id', 'total_reviews', 'files',
+                    'saved_at', 'pending'):
+            setattr(checkpoint, key, state.get(key, getattr(checkpoint, key)))
+
+        problem = checkpoint._stale_reason(max_age)
+        if problem:
+            logger.info(f"Discarding checkpoint {path}: {problem}")
+            checkpoint = cls(path, url, max_reviews)
+            checkpoint.clear()
+        return checkpoint
+
+    def _stale_reason(self, max_age):
+        """Return why this loaded checkpoint can no longer be resumed, or None."""
+        if not self.saved_at:
+            return "saved by an older version"
+        if time.time() - self.saved_at > max_age:
+            return "saved too long ago"
+
+        for path, saved in self.files.items():
+            if not isinstance(saved, dict):
+                return "saved by an older version"
+            size, mtime_ns = _file_state(path)
+            if size is None and saved['size']:
+                return f"{path} no longer exists"
+            if (size or 0) == saved['size'] and mtime_ns == saved['mtime_ns']:
+                continue
+            # Only a page this scrape was writing when it stopped may have changed the file
+            if not self.pending or (size or 0) < saved['size']:
+                return f"{path} was changed by another run"
+        return None
+
+    @property
+    def resuming(self):
+        """True if an earlier run already wrote some pages."""
+        return self.pages_done > 0
+
+    def restore_files(self):
+        """Cut every output file back to its size at the last checkpoint, dropping partial pages."""
+        for path, saved in self.files.items():
+            if os.path.exists(path) and os.path.getsize(path) > saved['size']:
+                with open(path, 'r+b') as f:
+                    f.truncate(saved['size'])
+
+    def begin_page(self):
+        """Mark that a page is about to be written, so a crash midway is recognised on resume."""
+        self.pending = True
+        self.save()
+
+    def record_page(self, reviews_written, next_id, files):
+        """
+        Save progress after a page has been written to every sink.
+
+        Args:
+            reviews_written (int): Reviews on the page
+            next_id (int): Id of the next review
+            files (dict): Path -> size of every output file
+        """
+        self.pages_done += 1
+        self.reviews_written += reviews_written
+        self.next_id = next_id
+        self.files = {path: {'size': size, 'mtime_ns': _file_state(path)[1]} for path, size in files.items()}
+        self.pending = False
+        self.save()
+
+    def save(self):
+        """Write the checkpoint atomically so a crash never leaves a half-written file."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.saved_at = time.time()
+        state = {
+            'url': self.url,
+            'max_reviews': self.max_reviews,
+            'backend': self.backend,
+            'pages_done': self.pages_done,
+            'reviews_written': self.reviews_written,
+            'next_id': self.next_id,
+            'total_reviews': self.total_reviews,
+            'files': self.files,
+            'saved_at': self.saved_at,
+            'pending': self.pending
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """Delete the checkpoint once the scrape has finished."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,328 @@
+# scrapers/driver_pool.py
+# selenium and webdriver-manager are imported when the first browser starts, not with this module
+import os
+import queue
+import threading
+import logging
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# 'lean' skips everything the scraper never reads; 'full' renders pages as a visitor sees them
+BROWSER_PROFILES = ('lean', 'full')
+DEFAULT_BROWSER_PROFILE = os.environ.get('SCRAPER_BROWSER_PROFILE', 'lean')
+
+# Review text is read from the DOM, so nothing below changes what is scraped
+LEAN_ARGUMENTS = [
+    # Still wide enough for the desktop layout the selectors target
+    "--window-size=1280,900",
+    "--blink-settings=imagesEnabled=false",
+    "--mute-audio",
+    "--autoplay-policy=user-gesture-required",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-notifications",
+    "--no-first-run",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication"
+]
+
+# 2 blocks the content type for every site
+LEAN_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.managed_default_content_settings.geolocation": 2,
+    "profile.managed_default_content_settings.notifications": 2,
+    "profile.managed_default_content_settings.plugins": 2,
+    "profile.managed_default_content_settings.popups": 2,
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False
+}
+
+# Fonts, media, maps, ads and trackers, matched by Chrome's DevTools URL blocking
+BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.mp3", "*.m3u8",
+    "*maps.googleapis.com*", "*maps.gstatic.com*", "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+    "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*googleadservices.com*", "*facebook.net*", "*facebook.com/tr*", "*connect.facebook*",
+    "*hotjar.com*", "*bat.bing.com*", "*criteo.com*", "*criteo.net*", "*taboola.com*",
+    "*outbrain.com*", "*adnxs.com*", "*scorecardresearch.com*", "*tiktok.com*", "*pinterest.com*",
+    "*snapchat.com*", "*clarity.ms*", "*newrelic.com*", "*nr-data.net*", "*optimizely.com*"
+]
+
+# Resolved chromedriver binary path, shared by every driver this process starts
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+def get_driver_path():
+    """Resolve the chromedriver binary once and return the cached path."""
+    global _driver_path
+
+    with _driver_path_lock:
+        if _driver_path is None:
+            # An explicit path skips webdriver-manager's version lookup entirely
+            _driver_path = os.environ.get('CHROMEDRIVER_PATH')
+            if not _driver_path:
+                from webdriver_manager.chrome import ChromeDriverManager
+                _driver_path = ChromeDriverManager().install()
+            logger.info(f"Using chromedriver at {_driver_path}")
+        return _driver_path
+
+def setup_driver(profile=None):
+    """
+    Set up and return a configured Chrome WebDriver instance.
+
+    Args:
+        profile (str, optional): 'lean' to skip images, media, fonts and
+                                 third-party requests and return from get()
+                                 once the DOM is ready, or 'full' to render
+                                 pages completely. Defaults to the
+                                 SCRAPER_BROWSER_PROFILE environment variable,
+                                 or 'lean'.
+    """
+    profile = profile or DEFAULT_BROWSER_PROFILE
+    if profile not in BROWSER_PROFILES:
+        raise ValueError(f"Unknown browser profile '{profile}', expected one of {BROWSER_PROFILES}")
+
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    # Add user-agent to avoid detection
+    chrome_options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36")
+
+    if profile == 'lean':
+        # Review cards are in the DOM at DOMContentLoaded; the waits handle anything rendered later
+        chrome_options.page_load_strategy = 'eager'
+        for argument in LEAN_ARGUMENTS:
+            chrome_options.add_argument(argument)
+        chrome_options.add_experimental_option("prefs", LEAN_PREFS)
+    else:
+        chrome_options.add_argument("--window-size=1920,1080")
+
+    service = Service(get_driver_path())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+
+    if profile == 'lean':
+        block_requests(driver, BLOCKED_URL_PATTERNS)
+    return driver
+
+def block_requests(driver, patterns):
+    """Make the browser fail every request whose URL matches one of `patterns` (* wildcards)."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        # Older chromedrivers without CDP still get the preference-based blocking
+        logger.warning(f"Could not block requests through DevTools: {e}")
+
+def is_driver_healthy(driver):
+    """Return True if the browser session still responds to commands."""
+    try:
+        # Both calls round-trip to chromedriver and fail once the session is gone
+        driver.current_url
+        return len(driver.window_handles) > 0
+    except Exception:
+        return False
+
+# Origins whose storage is cleared between borrowers, besides the page the session is on
+BOOKING_ORIGINS = ["https://www.booking.com", "https://secure.booking.com", "https://account.booking.com"]
+
+def reset_driver_state(driver):
+    """Clear cookies and web storage so the next property starts from a clean session."""
+    try:
+        # Storage is only reachable while still on the site's origin
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except Exception:
+        pass
+
+    try:
+        # delete_all_cookies only reaches the current domain; DevTools clears every domain's
+        # cookies, including consent cookies set on other booking.com subdomains
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        current = urlparse(driver.current_url)
+        origins = set(BOOKING_ORIGINS)
+        if current.scheme in ('http', 'https'):
+            origins.add(f"{current.scheme}://{current.netloc}")
+        for origin in origins:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                   {"origin": origin, "storageTypes": "all"})
+    except Exception as e:
+        # Drivers without DevTools still get the current domain's cookies cleared
+        logger.debug(f"Could not clear browser state through DevTools: {e}")
+        driver.delete_all_cookies()
+
+    driver.get("about:blank")
+
+def quit_driver(driver):
+    """Quit a driver, ignoring errors from sessions that already died."""
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.warning(f"Error quitting driver: {e}")
+
+class DriverPool:
+    """
+    A bounded pool of reusable Chrome WebDriver sessions.
+
+    Sessions are health-checked when borrowed and returned, have their cookies
+    and storage reset between properties, and are recycled after `max_uses`
+    scrapes or as soon as they crash.
+
+    Args:
+        size (int): Maximum number of concurrent browser sessions
+        max_uses (int): Number of scrapes after which a session is replaced
+        driver_factory (callable, optional): Function returning a new driver.
+                                             Defaults to setup_driver.
+    """
+
+    def __init__(self, size=2, max_uses=20, driver_factory=None):
+        if size < 1:
+            raise ValueError("Driver pool size must be at least 1")
+
+        self.size = size
+        self.max_uses = max_uses
+        self._driver_factory = driver_factory or setup_driver
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """
+        Borrow a driver for the duration of a `with` block.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free session.
+                                       If None, wait indefinitely.
+        """
+        if self._closed:
+            raise RuntimeError("Driver pool is closed")
+
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No browser session available after {timeout}s")
+
+        driver = None
+        crashed = True
+
+        try:
+            driver = self._checkout()
+            yield driver
+            crashed = False
+        except GeneratorExit:
+            # A consumer closed a generator that was holding the driver
+            crashed = False
+            raise
+        finally:
+            try:
+                if driver is not None:
+                    self._checkin(driver, crashed)
+            finally:
+                self._slots.release()
+
+    def _checkout(self):
+        """Take a healthy idle driver or start a new one."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+            if is_driver_healthy(driver):
+                return driver
+
+            logger.info("Discarding unhealthy browser session from pool")
+            self._discard(driver)
+
+        logger.info("Starting new browser session for pool")
+        driver = self._driver_factory()
+        with self._lock:
+            self._uses[id(driver)] = 0
+        return driver
+
+    def _checkin(self, driver, crashed):
+        """Return a driver to the pool, recycling it if it is worn out or broken."""
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+
+        if crashed or self._closed or uses >= self.max_uses or not is_driver_healthy(driver):
+            logger.info(f"Recycling browser session after {uses} uses")
+            self._discard(driver)
+            return
+
+        try:
+            reset_driver_state(driver)
+        except Exception as e:
+            logger.warning(f"Failed to reset browser session, recycling it: {e}")
+            self._discard(driver)
+            return
+
+        self._idle.put(driver)
+
+    def prewarm(self, count=None, background=True):
+        """
+        Start browser sessions ahead of the first scrape.
+
+        Args:
+            count (int, optional): Sessions to start; defaults to the pool size
+            background (bool): Start them in a daemon thread and return it,
+                               so application startup does not wait on Chrome
+
+        Returns:
+            Thread: The prewarm thread, or None if run in the foreground
+        """
+        def warm():
+            started = 0
+            while started < (count or self.size) and self._idle.qsize() < self.size:
+                # Only use free slots, so a scrape arriving meanwhile is never kept waiting
+                if self._closed or not self._slots.acquire(blocking=False):
+                    break
+                try:
+                    driver = self._driver_factory()
+                    with self._lock:
+                        self._uses[id(driver)] = 0
+                    self._idle.put(driver)
+                    started += 1
+                except Exception as e:
+                    logger.error(f"Could not prewarm browser session: {e}")
+                    break
+                finally:
+                    self._slots.release()
+            logger.info(f"Prewarmed {started} browser sessions")
+
+        if not background:
+            warm()
+            return None
+
+        thread = threading.Thread(target=warm, name="driver-pool-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def _discard(self, driver):
+        """Forget and quit a driver."""
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        quit_driver(driver)
+
+    def close(self):
+        """Quit every idle session and refuse further borrows."""
+        self._closed = True
+
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
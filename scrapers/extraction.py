@@ -0,0 +1,226 @@
+# scrapers/extraction.py
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+REVIEW_CARD_SELECTOR = "[data-testid='review-card']"
+
+# Columns written for every review
+OUTPUT_COLUMNS = [
+    'id', 'reviewer_name', 'reviewer_country', 'stay_date', 'review_type',
+    'review_date', 'room_type', 'nights_stayed', 'rating', 'review_title',
+    'review_text', 'review_pros', 'review_cons'
+]
+
+# Selectors tried in order for each review field, relative to a review card.
+# Each option is (css_selector, match_index); the index picks which of the
+# matching elements holds the value.
+FIELD_SELECTORS = {
+    'reviewer_name': [(".a3332d346a.e6208ee469", 0)],
+    'reviewer_country': [(".afac1f68d9.a1ad95c055", 0)],
+    'review_date': [("[data-testid='review-date']", 0)],
+    'rating': [
+        (".a3b8729ab1 div + div", 0),
+        (".a3b8729ab1", 0)
+    ],
+    'review_title': [
+        ("[data-testid='review-title']", 0),
+        (".f6431b446c.c5811cad6b.ee8547574e", 0)
+    ],
+    'room_type': [
+        ("[data-testid='review-room-name']", 0),
+        (".abf093bdfe:not(.d88f1120c1):not(.f45d8e4c32):not(.a1ad95c055)", 0)
+    ],
+    'nights_stayed': [("[data-testid='review-num-nights']", 0)],
+    'stay_date': [
+        ("[data-testid='review-stay-date']", 0),
+        (".d88f1120c1", 0)
+    ],
+    'review_type': [("[data-testid='review-traveler-type']", 0)],
+    'review_pros': [
+        ("[data-testid='review-positive-text'] .a53cbfa6de", 0),
+        (".c402354066 .a53cbfa6de", 0)
+    ],
+    'review_cons': [
+        ("[data-testid='review-negative-text'] .a53cbfa6de", 0),
+        (".c402354066 .a53cbfa6de", 1)
+    ]
+}
+
+TRAVELER_TYPES = ["Family", "Solo traveler", "Solo traveller", "Couple", "Business", "Group", "Friends"]
+
+# Runs in the browser and returns the raw text of every field of every review
+# card in a single round-trip. Arguments: card selector, FIELD_SELECTORS.
+EXTRACT_REVIEWS_JS = """
+const cardSelector = arguments[0];
+const fieldSelectors = arguments[1];
+return Array.from(document.querySelectorAll(cardSelector)).map(function (card) {
+    const fields = {};
+    for (const [field, options] of Object.entries(fieldSelectors)) {
+        fields[field] = null;
+        for (let i = 0; i < options.length; i++) {
+            const matches = card.querySelectorAll(options[i][0]);
+            if (matches.length > options[i][1]) {
+                fields[field] = [matches[options[i][1]].innerText, i];
+                break;
+            }
+        }
+    }
+    return {fields: fields, text: card.innerText};
+});
+"""
+
+# Elements showing the property's review total, tried in order after structured data.
+# Headings come last since they are the least specific.
+REVIEW_COUNT_SELECTORS = [
+    "[data-testid='review-score-link']",
+    "[data-testid='review-score-right-component']",
+    "[data-testid='review-score-component']",
+    "[data-testid='reviews-tab-trigger']",
+    "h2"
+]
+
+# "1,234 reviews" or "Guest reviews (1,234)"
+REVIEW_COUNT_PATTERNS = [r'(\d[\d,.]*)\s*reviews', r'reviews\s*\((\d[\d,.]*)\)']
+
+# Runs in the browser and returns [source, count text] for the property's review
+# total, from JSON-LD aggregateRating first and REVIEW_COUNT_SELECTORS second,
+# or null. Arguments: REVIEW_COUNT_SELECTORS, REVIEW_COUNT_PATTERNS.
+REVIEW_COUNT_JS = """
+const selectors = arguments[0];
+const patterns = arguments[1].map(function (p) { return new RegExp(p, 'i'); });
+function findCount(node) {
+    if (!node || typeof node !== 'object') return null;
+    const rating = node.aggregateRating;
+    if (rating && (rating.reviewCount || rating.ratingCount)) {
+        return String(rating.reviewCount || rating.ratingCount);
+    }
+    for (const value of Object.values(node)) {
+        const count = findCount(value);
+        if (count !== null) return count;
+    }
+    return null;
+}
+for (const script of document.querySelectorAll('script[type="application/ld+json"]')) {
+    try {
+        const count = findCount(JSON.parse(script.textContent));
+        if (count !== null) return ['json-ld', count];
+    } catch (e) {}
+}
+for (const selector of selectors) {
+    for (const element of document.querySelectorAll(selector)) {
+        for (const pattern of patterns) {
+            const match = (element.innerText || '').match(pattern);
+            if (match) return ['selector', match[1]];
+        }
+    }
+}
+return null;
+"""
+
+# Container of the cards on review list pages; it is rendered even past the last review
+REVIEW_LIST_SELECTOR = ".review_list, [data-testid='review-list']"
+
+# Bot checks served instead of the requested page
+CHALLENGE_SELECTORS = [
+    "#px-captcha",
+    "iframe[src*='captcha']",
+    "form#challenge-form",
+    "[data-testid='challenge']"
+]
+CHALLENGE_PATTERNS = [r'are you a robot', r'unusual traffic', r'access denied', r'verify you are (a )?human']
+
+# Cookie consent dialogs that can hide the reviews until accepted
+CONSENT_SELECTORS = ["#onetrust-banner-sdk", "#onetrust-consent-sdk", "[data-testid='consent-wall']"]
+
+# Runs in the browser on a page without review cards and returns why it looks
+# degraded: 'challenge', 'consent', 'no_list' when `listSelector` is given but
+# the review list is missing, or null when the page is simply empty.
+# Arguments: CHALLENGE_SELECTORS, CHALLENGE_PATTERNS, CONSENT_SELECTORS, list selector or null.
+PAGE_PROBLEM_JS = """
+const challengeSelectors = arguments[0];
+const challengePatterns = arguments[1].map(function (p) { return new RegExp(p, 'i'); });
+const consentSelectors = arguments[2];
+const listSelector = arguments[3];
+const text = document.title + ' ' + (document.body ? document.body.textContent.slice(0, 5000) : '');
+if (challengeSelectors.some(function (s) { return document.querySelector(s); }) ||
+        challengePatterns.some(function (p) { return p.test(text); })) {
+    return 'challenge';
+}
+if (consentSelectors.some(function (s) { return document.querySelector(s); })) return 'consent';
+if (listSelector && !document.querySelector(listSelector)) return 'no_list';
+return null;
+"""
+
+def build_review_record(fields, container_text):
+    """
+    Turn raw field matches for one review card into a review record.
+
+    Args:
+        fields (dict): Maps each FIELD_SELECTORS key to None if no selector
+                       matched, or to (text, option_index) of the first match
+        container_text (callable): Returns the full text of the review card.
+                                   Only called when a field needs it.
+
+    Returns:
+        dict: Review record with the scraper's standard fields
+    """
+    def text_of(field):
+        match = fields.get(field)
+        return (match[0] or "").strip() if match else None
+
+    def option_of(field):
+        match = fields.get(field)
+        return match[1] if match else None
+
+    review_data = {}
+
+    review_data['reviewer_name'] = text_of('reviewer_name') if fields.get('reviewer_name') else "Anonymous"
+    review_data['reviewer_country'] = text_of('reviewer_country') or ""
+
+    date_text = text_of('review_date') or ""
+    review_data['review_date'] = date_text.replace("Reviewed:", "").strip() if "Reviewed:" in date_text else date_text
+
+    # The whole score block repeats "Scored" in its text, the inner div does not
+    rating = text_of('rating') or ""
+    review_data['rating'] = rating.replace("Scored", "").strip() if option_of('rating') == 1 else rating
+
+    review_data['review_title'] = text_of('review_title') or ""
+
+    # The class-based room selector also matches unrelated labels
+    room_type = text_of('room_type') or ""
+    if option_of('room_type') == 1 and not any(word in room_type for word in ("Double", "King", "Room")):
+        room_type = ""
+    review_data['room_type'] = room_type
+
+    if fields.get('nights_stayed'):
+        nights_text = text_of('nights_stayed')
+        nights_match = re.search(r'(\d+)\s*night', nights_text) if "night" in nights_text else None
+        review_data['nights_stayed'] = nights_match.group(1) if nights_match else nights_text
+    else:
+        # Fall back to regex on container text
+        nights_match = re.search(r'(\d+)\s*nights?', container_text())
+        review_data['nights_stayed'] = nights_match.group(1) if nights_match else ""
+
+    review_data['stay_date'] = text_of('stay_date') or ""
+
+    if fields.get('review_type'):
+        review_data['review_type'] = text_of('review_type')
+    else:
+        # Try common traveler types via text search
+        text = container_text()
+        review_data['review_type'] = next((t_type for t_type in TRAVELER_TYPES if t_type in text), "")
+
+    review_data['review_pros'] = text_of('review_pros') or ""
+    review_data['review_cons'] = text_of('review_cons') or ""
+
+    # Combine pros and cons for full review text
+    review_text = ""
+    if review_data['review_pros']:
+        review_text += f"Pros: {review_data['review_pros']}\n"
+    if review_data['review_cons']:
+        review_text += f"Cons: {review_data['review_cons']}"
+    review_data['review_text'] = review_text.strip()
+
+    return review_data
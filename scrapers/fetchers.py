@@ -0,0 +1,119 @@
+# scrapers/fetchers.py
+import time
+import queue
+import logging
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from scrapers.utils import build_review_list_url, REVIEWS_PER_PAGE
+from scrapers.throttle import AdaptiveThrottle
+
+logger = logging.getLogger(__name__)
+
+REVIEW_LIST_URL = "https://www.booking.com/reviewlist.html"
+
+DEFAULT_HEADERS = {
+    'User-Agent': "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36",
+    'Accept': "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    'Accept-Language': "en-US,en;q=0.9",
+    'Accept-Encoding': "gzip, deflate",
+    'Connection': "keep-alive"
+}
+
+class HttpFetcher:
+    """
+    Browserless backend that fetches review list pages over pooled keep-alive sessions.
+
+    Any object with the same `fetch_pages` method can be passed to the scraper
+    as a backend, e.g. one pointed at a local stand-in server.
+
+    Args:
+        max_concurrency (int): Maximum number of pages fetched at once. This is
+                               also the number of pooled sessions.
+        timeout (float): Per-request timeout in seconds
+        base_url (str): Review list endpoint; override to use a stand-in server
+        rows (int): Reviews requested per page
+        headers (dict, optional): Extra headers merged over DEFAULT_HEADERS
+        throttle (AdaptiveThrottle, optional): Paces requests by the latency
+                                               and errors they see. One is
+                                               created per fetcher by default.
+    """
+
+    def __init__(self, max_concurrency=4, timeout=20, base_url=REVIEW_LIST_URL,
+                 rows=REVIEWS_PER_PAGE, headers=None, throttle=None):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.base_url = base_url
+        self.rows = rows
+        self.throttle = throttle or AdaptiveThrottle()
+        self._headers = dict(DEFAULT_HEADERS, **(headers or {}))
+        self._sessions = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="http-fetch")
+
+        for _ in range(max_concurrency):
+            self._sessions.put(self._new_session())
+
+    def _new_session(self):
+        """Create a session that keeps connections to the review host alive."""
+        session = requests.Session()
+        session.headers.update(self._headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=1)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @contextmanager
+    def session(self):
+        """Borrow a pooled session for one request."""
+        session = self._sessions.get()
+        try:
+            yield session
+        finally:
+            self._sessions.put(session)
+
+    def page_url(self, url, page_index):
+        """Return the review list URL for the zero-based `page_index` of a property."""
+        return build_review_list_url(url, offset=page_index * self.rows, rows=self.rows, base_url=self.base_url)
+
+    def fetch_page(self, url, page_index):
+        """Fetch the HTML of one review list page."""
+        page_url = self.page_url(url, page_index)
+        self.throttle.wait()
+        start = time.monotonic()
+        try:
+            with self.session() as session:
+                response = session.get(page_url, timeout=self.timeout)
+            # 429 and 503 are how the site sheds load, so they slow this fetcher down too
+            response.raise_for_status()
+        except Exception:
+            self.throttle.record(time.monotonic() - start, ok=False)
+            raise
+        self.throttle.record(time.monotonic() - start)
+        return response.text
+
+    def fetch_pages(self, url, page_indexes):
+        """
+        Fetch several review list pages concurrently.
+
+        Yields (page_index, html) in the order of `page_indexes`; html is None
+        for pages that failed to load.
+        """
+        futures = [(page_index, self._executor.submit(self.fetch_page, url, page_index))
+                   for page_index in page_indexes]
+
+        for page_index, future in futures:
+            try:
+                yield page_index, future.result()
+            except Exception as e:
+                logger.warning(f"Failed to fetch review page {page_index}: {e}")
+                yield page_index, None
+
+    def close(self):
+        """Stop the fetch threads and close every pooled connection."""
+        self._executor.shutdown(wait=False)
+        while True:
+            try:
+                self._sessions.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,168 @@
+# scrapers/jobs.py
+import time
+import uuid
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from scrapers.utils import extract_property_info
+from scrapers.metrics import ScrapeTrace
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+FINISHED = 'finished'
+FAILED = 'failed'
+
+class ScrapeJob:
+    """State of one background scrape, updated as pages are scraped."""
+
+    def __init__(self, url, max_reviews, incremental=False):
+        self.id = uuid.uuid4().hex
+        self.url = url
+        self.max_reviews = max_reviews
+        self.incremental = incremental
+        self.status = QUEUED
+        self.pages_done = 0
+        self.reviews_so_far = 0
+        self.result = None
+        self.error = None
+        self.trace = ScrapeTrace()
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def done(self):
+        return self.status in (FINISHED, FAILED)
+
+    def update_progress(self, pages_done, reviews_so_far):
+        """Progress callback passed to scrape_booking_reviews."""
+        self.pages_done = pages_done
+        self.reviews_so_far = reviews_so_far
+
+    def to_dict(self):
+        """Return the job status as a JSON-serializable dict."""
+        return {
+            "job_id": self.id,
+            "url": self.url,
+            "max_reviews_requested": self.max_reviews,
+            "incremental": self.incremental,
+            "status": self.status,
+            "pages_done": self.pages_done,
+            "reviews_so_far": self.reviews_so_far,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "metrics": self.trace.summary()
+        }
+
+class JobManager:
+    """
+    Run scrapes in a background executor and track them by job id.
+
+    Submitting a property that already has a queued or running job with the
+    same options returns that job instead of starting another scrape.
+
+    Args:
+        max_workers (int): Number of scrapes run at once
+        keep_finished (float): Seconds a finished job and its result are kept
+        cache (ResultCache, optional): Cache answered from before scraping
+        **scrape_kwargs: Passed to every scrape_booking_reviews call (pool, fetcher, ...)
+    """
+
+    def __init__(self, max_workers=2, keep_finished=3600, cache=None, **scrape_kwargs):
+        self.keep_finished = keep_finished
+        self.cache = cache
+        self._scrape_kwargs = scrape_kwargs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrape-job")
+        self._jobs = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def job_key(url, max_reviews, incremental=False):
+        """Key identifying identical requests: the normalized property plus scrape options."""
+        return extract_property_info(url), max_reviews, incremental
+
+    def submit(self, url, max_reviews=None, incremental=False):
+        """
+        Start a background scrape, or join an identical one already in flight.
+
+        Returns:
+            tuple: (ScrapeJob, created) where created is False for a de-duplicated request
+        """
+        key = self.job_key(url, max_reviews, incremental)
+
+        with self._lock:
+            self._expire_finished()
+
+            job = self._in_flight.get(key)
+            if job is not None:
+                return job, False
+
+            job = ScrapeJob(url, max_reviews, incremental)
+            self._jobs[job.id] = job
+            self._in_flight[key] = job
+
+        self._executor.submit(self._run, job, key)
+        return job, True
+
+    def get(self, job_id):
+        """Return the job with `job_id`, or None if it is unknown or expired."""
+        with self._lock:
+            self._expire_finished()
+            return self._jobs.get(job_id)
+
+    def _run(self, job, key):
+        job.status = RUNNING
+        job.started_at = time.time()
+
+        try:
+            # Imported on the first job so that starting the app does not load the scraper's dependencies
+            from scrapers.booking_scraper import scrape_booking_reviews
+
+            scrape = lambda: scrape_booking_reviews(job.url, job.max_reviews, progress=job.update_progress,
+                                                    incremental=job.incremental, trace=job.trace,
+                                                    **self._scrape_kwargs)
+            if self.cache is not None:
+                df = self.cache.get_or_scrape(job.url, job.max_reviews, scrape, job.incremental)
+            else:
+                df = scrape()
+            if df.empty:
+                job.error = "No reviews found or an error occurred."
+                job.status = FAILED
+            else:
+                job.result = df
+                job.reviews_so_far = len(df)
+                job.status = FINISHED
+        except Exception as e:
+            logger.error(f"Scrape job {job.id} failed: {e}")
+            job.error = str(e)
+            job.status = FAILED
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+            # Free the result after keep_finished even if no request comes in to expire it
+            timer = threading.Timer(self.keep_finished, self._expire_job, args=(job.id,))
+            timer.daemon = True
+            timer.start()
+
+    def _expire_job(self, job_id):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def _expire_finished(self):
+        """Drop finished jobs older than keep_finished. Caller holds the lock."""
+        cutoff = time.time() - self.keep_finished
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.done and job.finished_at is not None and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def shutdown(self):
+        """Stop accepting jobs; running scrapes are left to finish."""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,161 @@
+# scrapers/metrics.py
+import time
+import threading
+from contextlib import contextmanager
+
+# Prefix of every exported Prometheus metric name
+METRIC_PREFIX = "scraper"
+
+def _label_key(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+def _format_key(name, label_key):
+    """Render a metric and its labels as 'name{a=1,b=2}' for JSON summaries."""
+    if not label_key:
+        return name
+    return name + "{" + ",".join(f"{key}={value}" for key, value in label_key) + "}"
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _prometheus_labels(label_key):
+    if not label_key:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in label_key) + "}"
+
+class Metrics:
+    """
+    Thread-safe stage timings and counters.
+
+    Stages accumulate a count, total and maximum of their durations; counters
+    are plain totals. Both can carry labels, e.g. the field a selector
+    fallback was used for.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._counters = {}
+
+    def observe(self, stage, seconds, **labels):
+        """Record one duration of a stage."""
+        key = (stage, _label_key(labels))
+        with self._lock:
+            entry = self._stages.setdefault(key, {'count': 0, 'total': 0.0, 'max': 0.0})
+            entry['count'] += 1
+            entry['total'] += seconds
+            entry['max'] = max(entry['max'], seconds)
+
+    def inc(self, name, value=1, **labels):
+        """Add `value` to a counter."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    @contextmanager
+    def span(self, stage, **labels):
+        """Time the body of a `with` block as one occurrence of `stage`."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.monotonic() - start, **labels)
+
+    def count_fields(self, fields):
+        """
+        Count which selector matched each review field.
+
+        `fields` is the raw field dict passed to build_review_record. Option 0
+        is the primary selector, higher options are fallbacks and 'miss' means
+        no selector matched.
+        """
+        for field, match in fields.items():
+            option = match[1] if match else 'miss'
+            self.inc('selector_matches', field=field, option=option)
+            if option != 0:
+                self.inc('selector_fallbacks', field=field)
+
+    def summary(self):
+        """Return stage timings and counters as a JSON-serializable dict."""
+        with self._lock:
+            stages = {
+                _format_key(name, label_key): {
+                    'count': entry['count'],
+                    'total': round(entry['total'], 3),
+                    'max': round(entry['max'], 3)
+                }
+                for (name, label_key), entry in sorted(self._stages.items())
+            }
+            counters = {_format_key(name, label_key): value
+                        for (name, label_key), value in sorted(self._counters.items())}
+        return {'stages': stages, 'counters': counters}
+
+    def to_prometheus(self):
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            stages = sorted(self._stages.items())
+            counters = sorted(self._counters.items())
+
+        stage_name = f"{METRIC_PREFIX}_stage_seconds"
+        lines = [f"# HELP {stage_name} Time spent in each scrape stage.",
+                 f"# TYPE {stage_name} summary"]
+        for (name, label_key), entry in stages:
+            labels = _prometheus_labels((('stage', name),) + label_key)
+            lines.append(f"{stage_name}_count{labels} {entry['count']}")
+            lines.append(f"{stage_name}_sum{labels} {entry['total']:.6f}")
+
+        lines += [f"# HELP {stage_name}_max Longest single occurrence of each scrape stage.",
+                  f"# TYPE {stage_name}_max gauge"]
+        for (name, label_key), entry in stages:
+            labels = _prometheus_labels((('stage', name),) + label_key)
+            lines.append(f"{stage_name}_max{labels} {entry['max']:.6f}")
+
+        typed = set()
+        for (name, label_key), value in counters:
+            metric = f"{METRIC_PREFIX}_{name}_total"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            lines.append(f"{metric}{_prometheus_labels(label_key)} {value}")
+
+        return "\n".join(lines) + "\n"
+
+# Process-wide totals exported by the /metrics endpoint
+REGISTRY = Metrics()
+
+class ScrapeTrace(Metrics):
+    """
+    Timings and counters of a single scrape, also added to a shared registry.
+
+    Args:
+        registry (Metrics, optional): Registry every observation is forwarded
+                                      to. Defaults to the process-wide REGISTRY.
+    """
+
+    def __init__(self, registry=None):
+        super().__init__()
+        self.registry = REGISTRY if registry is None else registry
+        self.waits = {}
+        # Set by the page iterators once they see the property's last review page
+        self.reached_end = False
+
+    def observe(self, stage, seconds, **labels):
+        super().observe(stage, seconds, **labels)
+        self.registry.observe(stage, seconds, **labels)
+
+    def inc(self, name, value=1, **labels):
+        super().inc(name, value, **labels)
+        self.registry.inc(name, value, **labels)
+
+    @property
+    def complete(self):
+        """True if the scrape reached the last review page without giving up on a degraded page."""
+        with self._lock:
+            abandoned = any(name == 'abandoned_pages' for name, _ in self._counters)
+        return self.reached_end and not abandoned
+
+    def summary(self):
+        """Return this scrape's timings and counters, plus its wait summary."""
+        summary = super().summary()
+        summary['waits'] = self.waits
+        return summary
@@ -0,0 +1,101 @@
+# scrapers/normalize.py
+# pandas is imported inside each function rather than here, so importing the app stays fast
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Raw text formats first, then the ISO form written by an earlier normalization
+REVIEW_DATE_FORMATS = ["%d %B %Y", "%B %d, %Y", "%Y-%m-%d"]
+STAY_DATE_FORMATS = ["%B %Y", "%Y-%m-%d"]
+DATE_COLUMNS = ['review_date', 'stay_date']
+
+# "Pros: ...\nCons: ..." with either part optional; either part may span several lines
+REVIEW_TEXT_PATTERN = r'(?s)^(?:Pros: (?P<review_pros>.*?))?\n?(?:Cons: (?P<review_cons>.*))?$'
+
+def _parse_dates(text, formats):
+    """Parse a string Series trying each format in turn; unparseable values become NaT."""
+    import pandas as pd
+
+    parsed = pd.Series(pd.NaT, index=text.index, dtype='datetime64[ns]')
+    for fmt in formats:
+        missing = parsed.isna()
+        if not missing.any():
+            break
+        parsed[missing] = pd.to_datetime(text[missing], format=fmt, errors='coerce')
+    return parsed
+
+def normalize_reviews(df):
+    """
+    Convert scraped text columns into typed columns in one vectorized pass.
+
+    - rating becomes a float, handling duplicated values such as "7.0\\n7.0"
+      and a "Scored" prefix
+    - review_date and stay_date become datetime64 (stay dates are the first
+      day of the month)
+    - nights_stayed becomes a nullable integer
+    - review_text is split back into review_pros and review_cons
+
+    Already normalized frames pass through unchanged.
+
+    Args:
+        df (DataFrame): Reviews with the scraper's output columns
+
+    Returns:
+        DataFrame: A normalized copy
+    """
+    import pandas as pd
+
+    df = df.copy()
+    if df.empty:
+        return df
+
+    if 'rating' in df:
+        score = df['rating'].astype(str).str.extract(r'(\d+(?:[.,]\d+)?)', expand=False)
+        df['rating'] = pd.to_numeric(score.str.replace(',', '.', regex=False), errors='coerce')
+
+    if 'review_date' in df:
+        text = df['review_date'].astype(str).str.replace("Reviewed:", "", regex=False).str.strip()
+        df['review_date'] = _parse_dates(text, REVIEW_DATE_FORMATS)
+
+    if 'stay_date' in df:
+        df['stay_date'] = _parse_dates(df['stay_date'].astype(str).str.strip(), STAY_DATE_FORMATS)
+
+    if 'nights_stayed' in df:
+        nights = df['nights_stayed'].astype(str).str.extract(r'(\d+)', expand=False)
+        df['nights_stayed'] = pd.to_numeric(nights, errors='coerce').astype('Int64')
+
+    if 'review_text' in df:
+        text = df['review_text'].fillna("").astype(str)
+        parts = text.str.extract(REVIEW_TEXT_PATTERN)
+        df['review_pros'] = parts['review_pros'].fillna("").str.strip()
+        df['review_cons'] = parts['review_cons'].fillna("").str.strip()
+
+    if 'id' in df:
+        df['id'] = pd.to_numeric(df['id'], errors='coerce').astype('Int64')
+
+    return df
+
+def frame_to_records(df):
+    """
+    Turn a normalized frame into JSON-safe dicts.
+
+    Dates become ISO strings, and missing values of any dtype become None.
+    """
+    import pandas as pd
+
+    df = df.copy()
+    for col in DATE_COLUMNS:
+        if col in df and pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = df[col].dt.strftime('%Y-%m-%d')
+
+    records = df.astype(object).to_dict(orient='records')
+    return [{key: (None if pd.isna(value) else value) for key, value in record.items()}
+            for record in records]
+
+def normalize_records(records, columns):
+    """Normalize one page of output records and return them as JSON-safe dicts."""
+    if not records:
+        return records
+
+    import pandas as pd
+    return frame_to_records(normalize_reviews(pd.DataFrame(records, columns=columns)))
@@ -0,0 +1,166 @@
+# scrapers/parser.py
+import re
+import json
+import logging
+import soupsieve as sv
+from bs4 import BeautifulSoup
+from bs4.element import NavigableString, PreformattedString
+from scrapers.extraction import (
+    REVIEW_CARD_SELECTOR, FIELD_SELECTORS, REVIEW_COUNT_SELECTORS, REVIEW_COUNT_PATTERNS, CHALLENGE_SELECTORS,
+    CHALLENGE_PATTERNS, CONSENT_SELECTORS, build_review_record
+)
+
+logger = logging.getLogger(__name__)
+
+# Selectors are compiled once at import rather than on every card
+CARD_SELECTOR = sv.compile(REVIEW_CARD_SELECTOR)
+COMPILED_FIELD_SELECTORS = {
+    field: [(sv.compile(selector), match_idx) for selector, match_idx in options]
+    for field, options in FIELD_SELECTORS.items()
+}
+
+COMPILED_REVIEW_COUNT_SELECTORS = [sv.compile(selector) for selector in REVIEW_COUNT_SELECTORS]
+COMPILED_REVIEW_COUNT_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in REVIEW_COUNT_PATTERNS]
+COMPILED_CHALLENGE_SELECTORS = [sv.compile(selector) for selector in CHALLENGE_SELECTORS]
+COMPILED_CHALLENGE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in CHALLENGE_PATTERNS]
+COMPILED_CONSENT_SELECTORS = [sv.compile(selector) for selector in CONSENT_SELECTORS]
+
+# Elements that start a new line in rendered text, mirroring Selenium's .text
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3',
+    'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre',
+    'section', 'table', 'tr', 'ul'
+}
+SKIPPED_TAGS = {'script', 'style', 'template', 'noscript'}
+
+def _collect_text(node, parts):
+    """Append the text under `node` to `parts`, breaking lines at block elements."""
+    for child in node.children:
+        if isinstance(child, PreformattedString):
+            # Comments, CDATA and doctypes are never rendered
+            continue
+        if isinstance(child, NavigableString):
+            parts.append(str(child))
+        elif child.name in SKIPPED_TAGS:
+            continue
+        elif child.name == 'br':
+            parts.append("\n")
+        elif child.name in BLOCK_TAGS:
+            parts.append("\n")
+            _collect_text(child, parts)
+            parts.append("\n")
+        else:
+            _collect_text(child, parts)
+
+def element_text(element):
+    """Return the visible text of an element, approximating WebElement.text."""
+    parts = []
+    _collect_text(element, parts)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+def parse_card(card, trace=None):
+    """Extract one review record from a review card element, counting selector use in `trace`."""
+    fields = {}
+
+    for field, options in COMPILED_FIELD_SELECTORS.items():
+        fields[field] = None
+        for option_idx, (selector, match_idx) in enumerate(options):
+            matches = selector.select(card, limit=match_idx + 1)
+            if len(matches) > match_idx:
+                fields[field] = (element_text(matches[match_idx]), option_idx)
+                break
+
+    if trace is not None:
+        trace.count_fields(fields)
+    return build_review_record(fields, lambda: element_text(card))
+
+def parse_reviews(html, trace=None):
+    """
+    Parse every review card out of a Booking.com page without a browser.
+
+    Args:
+        html (str or bytes): Page HTML, e.g. a driver.page_source snapshot
+                             or a saved review page
+        trace (ScrapeTrace, optional): Counts which selector matched each field
+
+    Returns:
+        list: Review dicts with the same fields as scrape_reviews_from_page
+    """
+    soup = BeautifulSoup(html, 'lxml')
+    reviews = []
+
+    for idx, card in enumerate(CARD_SELECTOR.select(soup)):
+        try:
+            reviews.append(parse_card(card, trace))
+        except Exception as e:
+            logger.error(f"Error parsing review {idx}: {str(e)}")
+
+    return reviews
+
+def _json_ld_count(node):
+    """Return the first aggregateRating review count in a JSON-LD value, or None."""
+    if isinstance(node, list):
+        values = node
+    elif isinstance(node, dict):
+        rating = node.get('aggregateRating')
+        if isinstance(rating, dict) and (rating.get('reviewCount') or rating.get('ratingCount')):
+            return str(rating.get('reviewCount') or rating.get('ratingCount'))
+        values = node.values()
+    else:
+        return None
+
+    for value in values:
+        count = _json_ld_count(value)
+        if count is not None:
+            return count
+    return None
+
+def find_review_count(html):
+    """
+    Find a property's review total in page HTML, the way REVIEW_COUNT_JS does in the browser.
+
+    Returns:
+        tuple: (source, count text) where source is 'json-ld' or 'selector', or None
+    """
+    soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, 'lxml')
+
+    for script in soup.select('script[type="application/ld+json"]'):
+        try:
+            count = _json_ld_count(json.loads(script.string or ""))
+        except ValueError:
+            continue
+        if count is not None:
+            return 'json-ld', count
+
+    for selector in COMPILED_REVIEW_COUNT_SELECTORS:
+        for element in selector.select(soup):
+            text = element_text(element)
+            for pattern in COMPILED_REVIEW_COUNT_PATTERNS:
+                match = pattern.search(text)
+                if match:
+                    return 'selector', match.group(1)
+    return None
+
+def find_page_problem(html, list_selector=None):
+    """
+    Tell why a page without review cards looks degraded, the way PAGE_PROBLEM_JS does in the browser.
+
+    Returns:
+        str: 'challenge', 'consent' or 'no_list' (when `list_selector` is given
+             and does not match), or None for a page that is simply empty
+    """
+    soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, 'lxml')
+
+    title = soup.title.get_text() if soup.title else ""
+    body = soup.body.get_text()[:5000] if soup.body else ""
+    text = f"{title} {body}"
+    if (any(selector.select_one(soup) for selector in COMPILED_CHALLENGE_SELECTORS) or
+            any(pattern.search(text) for pattern in COMPILED_CHALLENGE_PATTERNS)):
+        return 'challenge'
+    if any(selector.select_one(soup) for selector in COMPILED_CONSENT_SELECTORS):
+        return 'consent'
+    if list_selector and not soup.select_one(list_selector):
+        return 'no_list'
+    return None
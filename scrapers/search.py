@@ -0,0 +1,327 @@
+# scrapers/search.py
+import re
+import csv
+import logging
+import unicodedata
+from scrapers.utils import property_key, review_fingerprint, parse_rating, parse_review_date
+from scrapers.normalize import REVIEW_TEXT_PATTERN
+from scrapers.storage import connect
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = "search.db"
+
+# Text fields that are tokenized, and how much a match in each counts towards the score
+SEARCH_FIELDS = {'title': 2, 'pros': 1, 'cons': 1}
+
+# Facet name -> review column; rating is bucketed, see rating_bucket
+FACETS = {
+    'country': 'reviewer_country',
+    'traveler_type': 'review_type',
+    'room_type': 'room_type',
+    'rating': 'rating'
+}
+
+# Too common in reviews to narrow a search down
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'but', 'by', 'for', 'from', 'had', 'has', 'have',
+    'i', 'in', 'is', 'it', 'its', 'me', 'my', 'of', 'on', 'or', 'our', 'so', 'that', 'the', 'there',
+    'this', 'to', 'was', 'we', 'were', 'with', 'you'
+}
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+REVIEW_TEXT_RE = re.compile(REVIEW_TEXT_PATTERN)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_docs (
+    doc_id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL UNIQUE,
+    property TEXT NOT NULL,
+    review_id INTEGER,
+    reviewer_name TEXT,
+    reviewer_country TEXT,
+    review_type TEXT,
+    room_type TEXT,
+    rating REAL,
+    review_date TEXT,
+    review_title TEXT,
+    review_pros TEXT,
+    review_cons TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_search_docs_property ON search_docs (property);
+CREATE TABLE IF NOT EXISTS search_postings (
+    token TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    field TEXT NOT NULL,
+    PRIMARY KEY (token, doc_id, field)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_search_postings_doc ON search_postings (doc_id);
+CREATE TABLE IF NOT EXISTS search_facets (
+    facet TEXT NOT NULL,
+    value TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    PRIMARY KEY (facet, value, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_search_facets_doc ON search_facets (doc_id);
+"""
+
+# Columns returned for every hit
+RESULT_COLUMNS = [
+    'property', 'review_id', 'reviewer_name', 'reviewer_country', 'review_type', 'room_type',
+    'rating', 'review_date', 'review_title', 'review_pros', 'review_cons'
+]
+
+UPSERT_DOC_SQL = """
+INSERT INTO search_docs (fingerprint, property, review_id, reviewer_name, reviewer_country, review_type,
+                         room_type, rating, review_date, review_title, review_pros, review_cons)
+VALUES (:fingerprint, :property, :review_id, :reviewer_name, :reviewer_country, :review_type,
+        :room_type, :rating, :review_date, :review_title, :review_pros, :review_cons)
+ON CONFLICT (fingerprint) DO UPDATE SET
+    property = excluded.property,
+    review_id = excluded.review_id,
+    reviewer_country = excluded.reviewer_country,
+    review_type = excluded.review_type,
+    room_type = excluded.room_type,
+    rating = excluded.rating,
+    review_pros = excluded.review_pros,
+    review_cons = excluded.review_cons
+"""
+
+def tokenize(text):
+    """Split text into lowercase, accent-free word tokens, without stopwords or single characters."""
+    text = unicodedata.normalize('NFKD', str(text or "").lower())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return [token for token in TOKEN_PATTERN.findall(text) if len(token) > 1 and token not in STOPWORDS]
+
+def rating_bucket(rating):
+    """Return the facet value for a rating: its whole number, e.g. '8' for 8.0 to 8.9."""
+    return None if rating is None else str(int(rating))
+
+def to_doc(prop, record):
+    """Convert an output or store record into the indexed columns."""
+    pros, cons = record.get('review_pros'), record.get('review_cons')
+    if not pros and not cons and record.get('review_text'):
+        # Records from the review store only keep the combined "Pros: ...\nCons: ..." text
+        match = REVIEW_TEXT_RE.match(record['review_text'])
+        if match:
+            pros, cons = match.group('review_pros'), match.group('review_cons')
+
+    review_id = record.get('review_id', record.get('id'))
+    return {
+        'fingerprint': review_fingerprint(record),
+        'property': prop,
+        'review_id': int(review_id) if str(review_id or "").isdigit() else None,
+        'reviewer_name': record.get('reviewer_name') or "",
+        'reviewer_country': (record.get('reviewer_country') or "").strip(),
+        'review_type': (record.get('review_type') or "").strip(),
+        'room_type': (record.get('room_type') or "").strip(),
+        'rating': parse_rating(record.get('rating')),
+        'review_date': parse_review_date(record.get('review_date')),
+        'review_title': record.get('review_title') or "",
+        'review_pros': (pros or "").strip(),
+        'review_cons': (cons or "").strip()
+    }
+
+class SearchIndex:
+    """
+    Keyword and faceted search over the reviews of every scraped property.
+
+    Kept in SQLite next to (or inside) the review store: an inverted index of
+    the tokens in each review's title, pros and cons, and one index per facet
+    (country, traveler type, room type and rating bucket). Queries only read
+    these indexes and the matching rows, so they stay fast as the corpus
+    grows. Reviews are keyed by fingerprint, so re-indexing a review
+    replaces its entry.
+
+    Args:
+        path (str): SQLite database file. May be the ReviewStore's file.
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        with connect(self.path) as conn:
+            conn.executescript(SCHEMA)
+
+    def add(self, prop, records):
+        """
+        Index reviews of one property, replacing earlier entries for the same reviews.
+
+        Args:
+            prop (str): Property key, see scrapers.utils.property_key
+            records (list): Output records as written by the scraper, or
+                            rows read from a ReviewStore
+
+        Returns:
+            int: Number of records indexed
+        """
+        docs = [to_doc(prop, record) for record in records]
+        if not docs:
+            return 0
+
+        with connect(self.path) as conn:
+            for doc in docs:
+                conn.execute(UPSERT_DOC_SQL, doc)
+                doc_id = conn.execute("SELECT doc_id FROM search_docs WHERE fingerprint = ?",
+                                      (doc['fingerprint'],)).fetchone()[0]
+                conn.execute("DELETE FROM search_postings WHERE doc_id = ?", (doc_id,))
+                conn.execute("DELETE FROM search_facets WHERE doc_id = ?", (doc_id,))
+
+                postings = {(token, doc_id, field)
+                            for field, column in (('title', 'review_title'), ('pros', 'review_pros'),
+                                                  ('cons', 'review_cons'))
+                            for token in tokenize(doc[column])}
+                conn.executemany("INSERT INTO search_postings (token, doc_id, field) VALUES (?, ?, ?)", postings)
+
+                facets = [(facet, rating_bucket(doc['rating']) if facet == 'rating' else doc[column], doc_id)
+                          for facet, column in FACETS.items()]
+                conn.executemany("INSERT INTO search_facets (facet, value, doc_id) VALUES (?, ?, ?)",
+                                 [facet for facet in facets if facet[1]])
+        return len(docs)
+
+    def index_store(self, store, batch_size=500):
+        """Index every review already in a ReviewStore and return the number indexed."""
+        count, batch, prop = 0, [], None
+        for row in store.iter_query(batch_size=batch_size):
+            if batch and (row['property'] != prop or len(batch) >= batch_size):
+                count += self.add(prop, batch)
+                batch = []
+            prop = row['property']
+            batch.append(row)
+        if batch:
+            count += self.add(prop, batch)
+
+        logger.info(f"Indexed {count} stored reviews")
+        return count
+
+    def import_csv(self, path, url):
+        """Index a booking_reviews_<property>.csv file written by the scraper."""
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            records = list(csv.DictReader(f))
+        return self.add(property_key(url), records)
+
+    def search(self, query=None, prop=None, facets=None, fields=None, limit=20, offset=0, facet_counts=True):
+        """
+        Find reviews containing every word of `query` and matching every facet filter.
+
+        Args:
+            query (str, optional): Words to look for; a trailing * matches any
+                                   word starting with the rest, e.g. "clean*".
+                                   Stopwords are ignored, so a query of only
+                                   stopwords finds nothing.
+            prop (str, optional): Only this property (a property key)
+            facets (dict, optional): Facet name (see FACETS) -> value or list
+                                     of values, any of which may match
+            fields (list, optional): Only search these of SEARCH_FIELDS
+            limit (int): Maximum number of hits returned
+            offset (int): Number of hits to skip
+            facet_counts (bool): Also count the hits per facet value
+
+        Returns:
+            dict: 'total' hits, the 'results' page (best matches first, then
+                  newest) and, with facet_counts, 'facets' mapping each facet
+                  to [{'value', 'count'}] sorted by count
+        """
+        fields = list(fields or SEARCH_FIELDS)
+        unknown = (set(fields) - set(SEARCH_FIELDS)) | (set(facets or {}) - set(FACETS))
+        if unknown:
+            raise ValueError(f"Unknown search fields or facets: {', '.join(sorted(unknown))}")
+
+        # One condition per word, each matching the postings of that word (or prefix)
+        terms = []
+        for word in (query or "").split():
+            prefix = word.endswith("*")
+            tokens = tokenize(word)
+            if not tokens:
+                continue
+            for token in tokens[:-1]:
+                terms.append(("token = ?", [token]))
+            if prefix:
+                # Every token starting with the prefix sorts between it and the prefix plus a high character
+                terms.append(("token >= ? AND token < ?", [tokens[-1], tokens[-1] + "\uffff"]))
+            else:
+                terms.append(("token = ?", [tokens[-1]]))
+
+        # A query made only of stopwords or single characters matches nothing, rather than everything
+        if query and query.strip() and not terms:
+            response = {'total': 0, 'results': []}
+            if facet_counts:
+                response['facets'] = {facet: [] for facet in FACETS}
+            return response
+
+        field_clause = f" AND field IN ({', '.join('?' * len(fields))})"
+        subqueries, params = [], []
+        for condition, values in terms:
+            subqueries.append(f"SELECT doc_id FROM search_postings WHERE {condition}{field_clause}")
+            params += values + fields
+        for facet, values in (facets or {}).items():
+            values = [values] if isinstance(values, str) else list(values)
+            if values:
+                subqueries.append(f"SELECT doc_id FROM search_facets WHERE facet = ? "
+                                  f"AND value IN ({', '.join('?' * len(values))})")
+                params += [facet] + [str(value) for value in values]
+        if prop is not None:
+            subqueries.append("SELECT doc_id FROM search_docs WHERE property = ?")
+            params.append(prop)
+        if not subqueries:
+            subqueries.append("SELECT doc_id FROM search_docs")
+
+        # Each hit is scored by looking up its postings for every word: a match in a
+        # title counts more than one in the pros or cons
+        weights = " ".join(f"WHEN '{field}' THEN {weight}" for field, weight in SEARCH_FIELDS.items())
+        score = " + ".join(f"(SELECT COALESCE(SUM(CASE field {weights} END), 0) FROM search_postings p "
+                           f"WHERE p.doc_id = m.doc_id AND {condition}{field_clause})"
+                           for condition, _ in terms) or "0"
+        score_params = [value for _, values in terms for value in values + fields]
+
+        with connect(self.path) as conn:
+            # Collect the hits once; counting, ranking and facet counts then only read them
+            conn.execute("CREATE TEMP TABLE hits (doc_id INTEGER PRIMARY KEY, score INTEGER NOT NULL)")
+            conn.execute(f"INSERT INTO hits SELECT m.doc_id, {score} FROM ({' INTERSECT '.join(subqueries)}) m",
+                         score_params + params)
+
+            total = conn.execute("SELECT COUNT(*) FROM hits").fetchone()[0]
+            sql = (f"SELECT {', '.join('d.' + c for c in RESULT_COLUMNS)}, h.score FROM hits h "
+                   "JOIN search_docs d ON d.doc_id = h.doc_id "
+                   "ORDER BY h.score DESC, d.review_date DESC, d.doc_id LIMIT ? OFFSET ?")
+            results = [dict(row) for row in conn.execute(sql, (limit, offset))]
+
+            response = {'total': total, 'results': results}
+            if facet_counts:
+                counts = {facet: [] for facet in FACETS}
+                sql = ("SELECT f.facet, f.value, COUNT(*) AS count FROM hits h "
+                       "JOIN search_facets f ON f.doc_id = h.doc_id GROUP BY f.facet, f.value "
+                       "ORDER BY count DESC, f.value")
+                for row in conn.execute(sql):
+                    counts[row['facet']].append({'value': row['value'], 'count': row['count']})
+                response['facets'] = counts
+            conn.execute("DROP TABLE hits")
+        return response
+
+    def stats(self):
+        """Return the number of indexed reviews, properties and distinct tokens."""
+        with connect(self.path) as conn:
+            reviews, properties = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT property) FROM search_docs").fetchone()
+            tokens = conn.execute("SELECT COUNT(DISTINCT token) FROM search_postings").fetchone()[0]
+        return {'reviews': reviews, 'properties': properties, 'tokens': tokens}
+
+class SearchSink:
+    """
+    Sink that adds each page of reviews to a SearchIndex as it is scraped.
+
+    Args:
+        index (SearchIndex): Index to write to
+        url (str): URL of the property being scraped
+    """
+
+    def __init__(self, index, url):
+        self.index = index
+        self.property = property_key(url)
+        self.rows_written = 0
+
+    def write(self, records):
+        if records:
+            self.rows_written += self.index.add(self.property, records)
+
+    def close(self):
+        pass
@@ -0,0 +1,119 @@
+# scrapers/sinks.py
+import os
+import csv
+import json
+import logging
+from scrapers.extraction import OUTPUT_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+class FileSink:
+    """
+    Base for sinks that write to a file, opened by the subclass on the first write.
+
+    Args:
+        path (str): File to write
+        append (bool): Add records to an existing file instead of replacing it
+    """
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self.append = append
+        self.rows_written = 0
+        self._file = None
+
+    def tell(self):
+        """Size in bytes of everything written so far, used for checkpoints."""
+        if self._file is not None:
+            return self._file.tell()
+        if self.append and os.path.exists(self.path):
+            return os.path.getsize(self.path)
+        return 0
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            logger.info(f"Saved {self.rows_written} reviews to {self.path}")
+
+class CsvSink(FileSink):
+    """
+    Write review records to a CSV file, flushing after every page.
+
+    The file is only opened on the first write, so a scrape that finds no
+    reviews leaves an existing file untouched.
+
+    Args:
+        path (str): CSV file to write
+        append (bool): Add rows to an existing file instead of replacing it
+        columns (list): Column order; defaults to OUTPUT_COLUMNS
+    """
+
+    def __init__(self, path, append=False, columns=None):
+        super().__init__(path, append)
+        self.columns = columns or OUTPUT_COLUMNS
+        self._writer = None
+
+    def _open(self):
+        write_header = not (self.append and os.path.exists(self.path) and os.path.getsize(self.path) > 0)
+        if not write_header:
+            # Keep appended rows aligned with the columns the file was created with
+            with open(self.path, newline='', encoding='utf-8-sig') as f:
+                self.columns = next(csv.reader(f), None) or self.columns
+        # utf-8-sig only emits the BOM at the start of a new file, not when appending
+        self._file = open(self.path, 'a' if self.append else 'w', newline='', encoding='utf-8-sig')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction='ignore',
+                                      lineterminator='\n')
+        if write_header:
+            self._writer.writeheader()
+
+    def write(self, records):
+        if not records:
+            return
+        if self._file is None:
+            self._open()
+        self._writer.writerows(records)
+        self._file.flush()
+        self.rows_written += len(records)
+
+class JsonLinesSink(FileSink):
+    """
+    Write review records as JSON Lines, one object per review, flushing after every page.
+
+    Args:
+        path (str): File to write
+        append (bool): Add records to an existing file instead of replacing it
+    """
+
+    def write(self, records):
+        if not records:
+            return
+        if self._file is None:
+            self._file = open(self.path, 'a' if self.append else 'w', encoding='utf-8')
+        for record in records:
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str))
+            self._file.write("\n")
+        self._file.flush()
+        self.rows_written += len(records)
+
+class MemorySink:
+    """Collect review records in memory, e.g. to answer an API request."""
+
+    def __init__(self):
+        self.records = []
+
+    @property
+    def rows_written(self):
+        return len(self.records)
+
+    def write(self, records):
+        self.records.extend(records)
+
+    def close(self):
+        pass
+
+    def to_frame(self, columns=None):
+        """Build a DataFrame from the collected records."""
+        import pandas as pd
+
+        return pd.DataFrame(self.records, columns=columns or OUTPUT_COLUMNS)
@@ -0,0 +1,234 @@
+# scrapers/storage.py
+import csv
+import sqlite3
+import logging
+from datetime import datetime
+from contextlib import contextmanager
+from scrapers.utils import (
+    property_key, review_fingerprint, parse_rating, parse_review_date,
+    parse_stay_month, parse_nights
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = "reviews.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    fingerprint TEXT PRIMARY KEY,
+    property TEXT NOT NULL,
+    review_id INTEGER,
+    reviewer_name TEXT,
+    reviewer_country TEXT,
+    stay_date TEXT,
+    review_type TEXT,
+    review_date TEXT,
+    room_type TEXT,
+    nights_stayed INTEGER,
+    rating REAL,
+    review_title TEXT,
+    review_text TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reviews_property ON reviews (property, review_id);
+CREATE INDEX IF NOT EXISTS idx_reviews_review_date ON reviews (review_date);
+CREATE INDEX IF NOT EXISTS idx_reviews_rating ON reviews (rating);
+"""
+
+# Rows are returned in this order. review_id is the review's position in its latest scrape,
+# so older rows of a property can share one; the fingerprint keeps the order stable
+QUERY_ORDER = "property, review_id, fingerprint"
+
+# Typed columns stored for every review, in export order
+STORE_COLUMNS = [
+    'property', 'review_id', 'reviewer_name', 'reviewer_country', 'stay_date', 'review_type',
+    'review_date', 'room_type', 'nights_stayed', 'rating', 'review_title', 'review_text'
+]
+
+UPSERT_SQL = """
+INSERT INTO reviews (fingerprint, property, review_id, reviewer_name, reviewer_country, stay_date,
+                     review_type, review_date, room_type, nights_stayed, rating, review_title,
+                     review_text, first_seen, last_seen)
+VALUES (:fingerprint, :property, :review_id, :reviewer_name, :reviewer_country, :stay_date,
+        :review_type, :review_date, :room_type, :nights_stayed, :rating, :review_title,
+        :review_text, :seen, :seen)
+ON CONFLICT (fingerprint) DO UPDATE SET
+    review_id = excluded.review_id,
+    reviewer_country = excluded.reviewer_country,
+    stay_date = excluded.stay_date,
+    review_type = excluded.review_type,
+    room_type = excluded.room_type,
+    nights_stayed = excluded.nights_stayed,
+    rating = excluded.rating,
+    last_seen = excluded.last_seen
+"""
+
+def to_store_row(prop, record, seen):
+    """Convert an output record into typed column values for the store."""
+    return {
+        'fingerprint': review_fingerprint(record),
+        'property': prop,
+        'review_id': int(record['id']) if str(record.get('id', "")).isdigit() else None,
+        'reviewer_name': record.get('reviewer_name', ""),
+        'reviewer_country': record.get('reviewer_country', ""),
+        'stay_date': parse_stay_month(record.get('stay_date')),
+        'review_type': record.get('review_type', ""),
+        'review_date': parse_review_date(record.get('review_date')),
+        'room_type': record.get('room_type', ""),
+        'nights_stayed': parse_nights(record.get('nights_stayed')),
+        'rating': parse_rating(record.get('rating')),
+        'review_title': record.get('review_title', ""),
+        'review_text': record.get('review_text', ""),
+        'seen': seen
+    }
+
+@contextmanager
+def connect(path):
+    """Open a connection to a SQLite file for one transaction; safe to use from any thread."""
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+class ReviewStore:
+    """
+    A single SQLite database holding typed reviews for every property.
+
+    Reviews are keyed by their fingerprint, so re-scraping a property updates
+    existing rows instead of duplicating them. Dates are stored as ISO
+    strings, ratings as REAL and nights as INTEGER, with indexes on
+    property, review_date and rating.
+
+    Args:
+        path (str): SQLite database file
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        with connect(self.path) as conn:
+            conn.executescript(SCHEMA)
+
+    def upsert(self, prop, records):
+        """
+        Insert or update reviews of one property.
+
+        Args:
+            prop (str): Property key, see scrapers.utils.property_key
+            records (list): Output records as written by the scraper
+
+        Returns:
+            int: Number of records stored
+        """
+        seen = datetime.utcnow().isoformat(timespec='seconds')
+        rows = [to_store_row(prop, record, seen) for record in records]
+        with connect(self.path) as conn:
+            conn.executemany(UPSERT_SQL, rows)
+        return len(rows)
+
+    def query(self, prop=None, since=None, until=None, min_rating=None, max_rating=None,
+              limit=None, offset=0):
+        """
+        Return stored reviews as dicts, filtered on the indexed columns.
+
+        Args:
+            prop (str, optional): Only this property
+            since, until (str, optional): Inclusive ISO review_date bounds
+            min_rating, max_rating (float, optional): Inclusive rating bounds
+            limit (int, optional): Maximum number of reviews
+            offset (int): Number of matching reviews to skip
+
+        Returns:
+            list: Review dicts with STORE_COLUMNS keys
+        """
+        return list(self.iter_query(prop, since, until, min_rating, max_rating, limit, offset))
+
+    def iter_query(self, prop=None, since=None, until=None, min_rating=None, max_rating=None,
+                   limit=None, offset=0, batch_size=500):
+        """Like query, but yield reviews while reading them in batches of `batch_size` rows."""
+        where, params = self._filters(prop, since, until, min_rating, max_rating)
+        sql = f"SELECT {', '.join(STORE_COLUMNS)} FROM reviews{where} ORDER BY {QUERY_ORDER}"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else limit, offset]
+
+        with connect(self.path) as conn:
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+
+    def count(self, prop=None, since=None, until=None, min_rating=None, max_rating=None):
+        """Return the number of stored reviews matching the filters."""
+        where, params = self._filters(prop, since, until, min_rating, max_rating)
+        with connect(self.path) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM reviews{where}", params).fetchone()[0]
+
+    def properties(self):
+        """Return every stored property with its review count and average rating."""
+        sql = ("SELECT property, COUNT(*) AS reviews, ROUND(AVG(rating), 2) AS avg_rating "
+               "FROM reviews GROUP BY property ORDER BY property")
+        with connect(self.path) as conn:
+            return [dict(row) for row in conn.execute(sql)]
+
+    def export_csv(self, path, **filters):
+        """Write the reviews matching `filters` (see query) to a CSV file and return the row count."""
+        where, params = self._filters(**filters)
+        sql = f"SELECT {', '.join(STORE_COLUMNS)} FROM reviews{where} ORDER BY {QUERY_ORDER}"
+        count = 0
+
+        with connect(self.path) as conn, open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(STORE_COLUMNS)
+            for row in conn.execute(sql, params):
+                writer.writerow(row)
+                count += 1
+
+        logger.info(f"Exported {count} reviews to {path}")
+        return count
+
+    def import_csv(self, path, url):
+        """Load a booking_reviews_<property>.csv file written by the scraper into the store."""
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            records = list(csv.DictReader(f))
+        return self.upsert(property_key(url), records)
+
+    @staticmethod
+    def _filters(prop=None, since=None, until=None, min_rating=None, max_rating=None):
+        """Build a WHERE clause and its parameters from query filters."""
+        clauses, params = [], []
+        for column, op, value in (('property', '=', prop), ('review_date', '>=', since),
+                                  ('review_date', '<=', until), ('rating', '>=', min_rating),
+                                  ('rating', '<=', max_rating)):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+class SqliteSink:
+    """
+    Sink that upserts each page of reviews into a ReviewStore.
+
+    Args:
+        store (ReviewStore): Store to write to
+        url (str): URL of the property being scraped
+    """
+
+    def __init__(self, store, url):
+        self.store = store
+        self.property = property_key(url)
+        self.rows_written = 0
+
+    def write(self, records):
+        if records:
+            self.rows_written += self.store.upsert(self.property, records)
+
+    def close(self):
+        pass
@@ -0,0 +1,105 @@
+# scrapers/streaming.py
+import json
+import math
+import zlib
+from scrapers.normalize import frame_to_records
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# Rows converted to dicts at a time when streaming a DataFrame
+FRAME_CHUNK_SIZE = 500
+
+def iter_frame_records(df, chunk_size=FRAME_CHUNK_SIZE):
+    """Yield JSON-safe review dicts from a DataFrame without converting it all at once."""
+    for start in range(0, len(df), chunk_size):
+        for record in frame_to_records(df.iloc[start:start + chunk_size]):
+            yield record
+
+def iter_ndjson(records):
+    """Encode records as newline-delimited JSON, one line per record."""
+    for record in records:
+        yield (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+
+def iter_gzip(chunks, level=6):
+    """
+    Gzip-compress a stream of byte chunks incrementally.
+
+    Only compressed output that is ready is yielded, so memory use stays
+    bounded no matter how long the stream is.
+    """
+    # wbits=31 selects the gzip container instead of a raw zlib stream
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def parse_paging(params, default_limit=None, max_limit=None):
+    """
+    Read `offset` and `limit` from request parameters.
+
+    Args:
+        params (dict): JSON body or query string values
+        default_limit (int, optional): Limit used when none is given; None means no limit
+        max_limit (int, optional): Largest limit accepted
+
+    Returns:
+        tuple: (offset, limit)
+
+    Raises:
+        ValueError: If either value is not a non-negative integer or limit is too large
+    """
+    try:
+        offset = int(params.get('offset') or 0)
+        limit = params.get('limit')
+        limit = default_limit if limit in (None, "") else int(limit)
+    except (TypeError, ValueError):
+        raise ValueError("offset and limit must be integers.")
+
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("offset and limit must not be negative.")
+    if max_limit is not None and limit is not None and limit > max_limit:
+        raise ValueError(f"limit must be at most {max_limit}.")
+    return offset, limit
+
+def parse_count(params, name):
+    """
+    Read an optional non-negative integer, such as max_reviews, from request parameters.
+
+    Raises:
+        ValueError: If the value is given but is not a non-negative integer
+    """
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    # JSON true and 2.5 would otherwise pass int() as 1 and 2
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError(f"{name} must be an integer.")
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be an integer.")
+
+    if value < 0:
+        raise ValueError(f"{name} must not be negative.")
+    return value
+
+def parse_number(params, name):
+    """
+    Read an optional number, such as min_rating, from request parameters.
+
+    Raises:
+        ValueError: If the value is given but is not a finite number
+    """
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number.")
+
+    if not math.isfinite(value):
+        raise ValueError(f"{name} must be a number.")
+    return value
@@ -0,0 +1,135 @@
+# scrapers/throttle.py
+import os
+import time
+import random
+import threading
+import weakref
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Attempts made for a degraded page after the first one
+DEFAULT_PAGE_RETRIES = int(os.environ.get('SCRAPER_PAGE_RETRIES', 3))
+# Seconds the first retry waits at most; each further retry doubles it, up to BACKOFF_MAX
+BACKOFF_BASE = float(os.environ.get('SCRAPER_BACKOFF_BASE', 1.0))
+BACKOFF_MAX = 30.0
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_MAX):
+    """
+    Return the seconds to wait before retry number `attempt` (from 0).
+
+    Uses full jitter: a random delay up to an exponentially growing limit, so
+    workers that failed together do not retry together.
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+class AdaptiveThrottle:
+    """
+    Paces one worker's requests to what the site currently sustains.
+
+    Requests start unthrottled. An error, a degraded page or a response much
+    slower than the worker's usual latency multiplies the gap between
+    requests; every healthy response shrinks it by a fixed step. The request
+    rate so backs off quickly under load and creeps back up once the site
+    recovers (AIMD, as TCP does).
+
+    Safe to share between threads, e.g. the fetch threads of an HttpFetcher.
+
+    Args:
+        min_interval (float): Smallest gap between requests in seconds
+        max_interval (float): Largest gap the throttle backs off to
+        recovery_step (float): Seconds taken off the gap per healthy response
+        slow_factor (float): A response this many times slower than the
+                             latency baseline counts as a sign of overload
+        retries (int): Attempts for a degraded page after the first one
+        backoff_base (float): Upper bound of the first retry delay
+    """
+
+    def __init__(self, min_interval=0.0, max_interval=30.0, recovery_step=0.1, slow_factor=3.0,
+                 retries=DEFAULT_PAGE_RETRIES, backoff_base=BACKOFF_BASE):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.recovery_step = recovery_step
+        self.slow_factor = slow_factor
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.interval = min_interval
+        self.latency = None
+        self.baseline = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.errors = 0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next request is allowed, and return the seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+        return slot - now
+
+    def record(self, latency=None, ok=True):
+        """
+        Adjust the pace after a response.
+
+        Args:
+            latency (float, optional): Seconds the request took
+            ok (bool): False for errors and degraded pages
+        """
+        with self._lock:
+            self.requests += 1
+            self.error_rate = 0.8 * self.error_rate + 0.2 * (0.0 if ok else 1.0)
+
+            slow = False
+            if latency is not None:
+                self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+                # The baseline follows improvements at once and a lasting slowdown gradually
+                if self.baseline is None or self.latency < self.baseline:
+                    self.baseline = self.latency
+                else:
+                    self.baseline += 0.05 * (self.latency - self.baseline)
+                slow = self.requests > 3 and latency > self.slow_factor * self.baseline
+
+            if not ok or slow:
+                self.errors += int(not ok)
+                previous = self.interval
+                self.interval = min(self.max_interval, max(self.interval * 2, self.recovery_step * 5))
+                if self.interval != previous:
+                    logger.info(f"Slowing down to one request every {self.interval:.2f}s "
+                                f"({'error' if not ok else f'{latency:.2f}s response'})")
+            else:
+                self.interval = max(self.min_interval, self.interval - self.recovery_step)
+
+    def backoff(self, attempt):
+        """Sleep before retry number `attempt` (from 0) and return the seconds slept."""
+        delay = backoff_delay(attempt, self.backoff_base)
+        time.sleep(delay)
+        return delay
+
+    def stats(self):
+        """Return the current pace, latency and error rate."""
+        with self._lock:
+            return {
+                'interval': round(self.interval, 3),
+                'latency': round(self.latency, 3) if self.latency is not None else None,
+                'baseline_latency': round(self.baseline, 3) if self.baseline is not None else None,
+                'error_rate': round(self.error_rate, 3),
+                'requests': self.requests,
+                'errors': self.errors
+            }
+
+# One throttle per browser session, kept for as long as the session lives
+_driver_throttles = weakref.WeakKeyDictionary()
+_driver_throttles_lock = threading.Lock()
+
+def throttle_for(driver):
+    """Return the AdaptiveThrottle of a browser session, creating it on first use."""
+    with _driver_throttles_lock:
+        throttle = _driver_throttles.get(driver)
+        if throttle is None:
+            throttle = _driver_throttles[driver] = AdaptiveThrottle()
+        return throttle
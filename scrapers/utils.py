@@ -1,14 +1,35 @@
 # scrapers/utils.py
+import os
 import re
+import hashlib
+from datetime import datetime
+from urllib.parse import urlencode
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+def configure_logging(log_dir=None, level=logging.INFO):
+    """
+    Log to the console and, if `log_dir` is given, to a timestamped file in it.
+
+    Importing the scraper no longer configures logging, so applications and
+    scripts call this once at startup.
+
+    Returns:
+        str: Path of the log file, or None without `log_dir`
+    """
+    handlers = [logging.StreamHandler()]
+    log_filename = None
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+        log_filename = os.path.join(log_dir, f"scraper_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+        handlers.append(logging.FileHandler(log_filename))
+
+    logging.basicConfig(level=level, format=LOG_FORMAT, handlers=handlers)
+    return log_filename
+
 def validate_booking_url(url):
     """Validate that the URL is a proper Booking.com hotel URL."""
     if not url:
@@ -27,4 +48,77 @@ def extract_property_info(url):
         country_code = match.group(2)   # gb
         property_name = match.group(3)  # london-visitors
         return property_type, country_code, property_name
-    return None, None, None
\ No newline at end of file
+    return None, None, None
+
+# Reviews per review list page; kept here so modules can use it without loading an HTTP client
+REVIEWS_PER_PAGE = 25
+
+def build_review_list_url(url, offset=0, rows=REVIEWS_PER_PAGE, base_url="https://www.booking.com/reviewlist.html"):
+    """Build the URL of the paginated review list for a property, starting at `offset`."""
+    property_type, country_code, property_name = extract_property_info(url)
+    if not property_name:
+        raise ValueError(f"Not a Booking.com property URL: {url}")
+
+    params = {
+        'pagename': property_name,
+        'cc1': country_code,
+        'type': 'total',
+        'sort': 'f_recent_desc',
+        'offset': offset,
+        'rows': rows
+    }
+    return f"{base_url}?{urlencode(params)}"
+
+def property_key(url):
+    """Return a "country_code/property_name" key identifying a property across URL variants."""
+    property_type, country_code, property_name = extract_property_info(url)
+    if not property_name:
+        return None
+    return f"{country_code}/{property_name}"
+
+def parse_rating(text):
+    """Parse a review score such as "8.0", "Scored 8.0" or "8.0\n8.0" into a float."""
+    match = re.search(r'\d+(?:[.,]\d+)?', str(text or ""))
+    return float(match.group(0).replace(',', '.')) if match else None
+
+def parse_review_date(text):
+    """Parse a review date such as "11 April 2025" into an ISO date string."""
+    text = str(text or "").replace("Reviewed:", "").strip()
+    for fmt in ("%d %B %Y", "%B %d, %Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+def parse_stay_month(text):
+    """Parse a stay date such as "March 2025" into the ISO date of the first of that month."""
+    text = str(text or "").strip()
+    for fmt in ("%B %Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text, fmt).date().replace(day=1).isoformat()
+        except ValueError:
+            continue
+    return None
+
+def parse_nights(text):
+    """Parse a number of nights such as "3" or "3 nights" into an int."""
+    match = re.search(r'\d+', str(text or ""))
+    return int(match.group(0)) if match else None
+
+def parse_review_count(text):
+    """Parse a review total such as "1,234" or "1.234" into an int."""
+    digits = re.sub(r'\D', '', str(text or ""))
+    return int(digits) if digits else None
+
+def review_fingerprint(review):
+    """Return a stable identifier for a review from its reviewer, date, title and text."""
+    def field(name):
+        value = review.get(name)
+        return "" if value is None else str(value).strip()
+
+    # Compare dates by value so raw and normalized copies of a review match
+    review_date = parse_review_date(field('review_date')) or field('review_date')
+    text_hash = hashlib.sha1(field('review_text').encode('utf-8')).hexdigest()
+    key = "\x1f".join([field('reviewer_name'), review_date, field('review_title'), text_hash])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
@@ -0,0 +1,123 @@
+# scrapers/waits.py
+# Selenium is imported inside the wait functions, so WaitBudget can be used without loading it
+import time
+import logging
+from scrapers.extraction import REVIEW_CARD_SELECTOR
+
+logger = logging.getLogger(__name__)
+
+class WaitBudget:
+    """
+    Per-page wait limits plus a record of how long each wait actually took.
+
+    Args:
+        page_timeout (float): Maximum seconds any single wait may take
+        poll_interval (float): Seconds between condition checks
+        stable_for (float): Seconds the review card count must stay unchanged
+                            before the card set counts as loaded
+    """
+
+    def __init__(self, page_timeout=15, poll_interval=0.25, stable_for=0.5):
+        self.page_timeout = page_timeout
+        self.poll_interval = poll_interval
+        self.stable_for = stable_for
+        self.page = None
+        self.timings = []
+
+    def record(self, label, seconds, timed_out=False):
+        """Store the duration of one wait against the current page."""
+        self.timings.append({
+            'page': self.page,
+            'label': label,
+            'seconds': round(seconds, 3),
+            'timed_out': timed_out
+        })
+        if timed_out:
+            logger.warning(f"Wait '{label}' timed out after {seconds:.2f}s on page {self.page}")
+
+    def total(self, label=None):
+        """Total seconds spent waiting, optionally for a single label."""
+        return sum(t['seconds'] for t in self.timings if label is None or t['label'] == label)
+
+    def summary(self):
+        """Return count, total and max seconds per wait label."""
+        summary = {}
+        for timing in self.timings:
+            entry = summary.setdefault(timing['label'], {'count': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+            entry['count'] += 1
+            entry['total'] = round(entry['total'] + timing['seconds'], 3)
+            entry['max'] = max(entry['max'], timing['seconds'])
+            entry['timeouts'] += int(timing['timed_out'])
+        return summary
+
+def wait_until(driver, condition, budget, label, timeout=None):
+    """
+    Wait for `condition` and record the time taken in `budget`.
+
+    Returns the condition's value, or None if it did not hold in time.
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+
+    start = time.monotonic()
+    timeout = budget.page_timeout if timeout is None else timeout
+
+    try:
+        result = WebDriverWait(driver, timeout, poll_frequency=budget.poll_interval).until(condition)
+        budget.record(label, time.monotonic() - start)
+        return result
+    except TimeoutException:
+        budget.record(label, time.monotonic() - start, timed_out=True)
+        return None
+
+def wait_for_document_ready(driver, budget, label='document_ready'):
+    """Wait until the browser has parsed the current document."""
+    return wait_until(
+        driver,
+        lambda d: d.execute_script("return document.readyState") in ('interactive', 'complete'),
+        budget,
+        label
+    )
+
+def wait_for_review_cards(driver, budget, label='review_cards'):
+    """
+    Wait until review cards are present and their count has stopped changing.
+
+    Returns the list of review card elements, which is empty if none appeared.
+    """
+    from selenium.webdriver.common.by import By
+
+    state = {'count': -1, 'since': None}
+
+    def cards_stable(d):
+        cards = d.find_elements(By.CSS_SELECTOR, REVIEW_CARD_SELECTOR)
+        now = time.monotonic()
+
+        # Restart the stability window whenever the card set changes size
+        if not cards or len(cards) != state['count']:
+            state['count'] = len(cards)
+            state['since'] = now
+            return False
+
+        return cards if now - state['since'] >= budget.stable_for else False
+
+    cards = wait_until(driver, cards_stable, budget, label)
+    if cards is None:
+        # Fall back to whatever is on the page once the budget runs out
+        return driver.find_elements(By.CSS_SELECTOR, REVIEW_CARD_SELECTOR)
+    return cards
+
+def wait_for_page_change(driver, old_cards, budget, label='pagination'):
+    """
+    Wait until pagination has detached `old_cards` from the page.
+
+    Returns True once the old card set is gone, False if it is still there
+    when the budget runs out.
+    """
+    from selenium.webdriver.support import expected_conditions as EC
+
+    if not old_cards:
+        return True
+
+    # The new cards themselves are awaited by wait_for_review_cards
+    return wait_until(driver, EC.staleness_of(old_cards[0]), budget, label) is not None
@@ -0,0 +1,374 @@
+# scrapers/workers.py
+import os
+import time
+import queue
+import logging
+import multiprocessing
+from itertools import count
+from collections import namedtuple, deque, Counter
+from scrapers.utils import validate_booking_url, review_fingerprint, configure_logging, REVIEWS_PER_PAGE
+from scrapers.extraction import OUTPUT_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# One unit of work: `count` reviews of `url` starting at review `offset`.
+# count is None for every review of a property.
+Shard = namedtuple('Shard', ['id', 'url', 'index', 'offset', 'count'])
+
+# Seconds between checks that every worker process is still alive
+LIVENESS_INTERVAL = 1.0
+
+def plan_shards(urls, max_reviews=None, shard_size=None, rows=REVIEWS_PER_PAGE):
+    """
+    Split properties into shards.
+
+    A property is split into ranges of `shard_size` reviews when both
+    max_reviews and shard_size are given, so one property can be scraped
+    by several workers. Otherwise each property is a single shard.
+    shard_size is rounded up to whole review list pages of `rows`, so no
+    page is loaded by two shards.
+    """
+    if shard_size:
+        shard_size = -(-shard_size // rows) * rows
+
+    shards = []
+    for url in urls:
+        if shard_size and max_reviews and max_reviews > shard_size:
+            for index, offset in enumerate(range(0, max_reviews, shard_size)):
+                shards.append(Shard(len(shards), url, index, offset, min(shard_size, max_reviews - offset)))
+        else:
+            shards.append(Shard(len(shards), url, 0, 0, max_reviews))
+    return shards
+
+def current_rss_mb():
+    """Return the resident memory of this process in MB."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        # Peak rather than current usage, in KB on Linux
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _iter_shard(shard, pool, fetcher, options):
+    """Yield the pages of reviews in one shard."""
+    from scrapers.booking_scraper import iter_review_pages, iter_pages_direct, borrow_drivers
+    from scrapers.waits import WaitBudget
+
+    if shard.offset == 0:
+        yield from iter_review_pages(
+            shard.url, shard.count, pool=pool, fetcher=fetcher, page_timeout=options['page_timeout'],
+            extraction=options['extraction'], navigation=options['navigation'], sessions=options['sessions']
+        )
+        return
+
+    # Later ranges of a property are only reached by opening review list pages by offset
+    with borrow_drivers(pool, options['sessions']) as drivers:
+        budgets = [WaitBudget(page_timeout=options['page_timeout'], stable_for=0) for _ in drivers]
+        yield from iter_pages_direct(shard.url, shard.count, drivers, budgets, options['extraction'],
+                                     start_offset=shard.offset)
+
+def _worker_main(worker_id, inbox, results, options):
+    """
+    Scrape the shards sent to `inbox` until told to stop, sending pages to `results`.
+
+    Each worker owns its browser sessions and HTTP connections. Pages are
+    normalized here, so post-processing is spread across the workers too.
+    """
+    configure_logging(options['log_dir'])
+    if options.get('address_space_limit_mb'):
+        import resource
+        limit = int(options['address_space_limit_mb'] * 2 ** 20)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    from scrapers.booking_scraper import to_output_record
+    from scrapers.driver_pool import DriverPool
+    from scrapers.fetchers import HttpFetcher
+    from scrapers.normalize import normalize_records
+
+    pool = DriverPool(size=options['sessions'], max_uses=options['max_uses'],
+                      driver_factory=options['driver_factory'])
+    fetcher = HttpFetcher(max_concurrency=options['http_concurrency']) if options['backend'] == 'http' else None
+
+    try:
+        while True:
+            shard = inbox.get()
+            if shard is None:
+                break
+
+            error = None
+            try:
+                for page_reviews in _iter_shard(shard, pool, fetcher, options):
+                    # ids are assigned by the merger once the order across shards is known
+                    records = [to_output_record(review, None) for review in page_reviews]
+                    if options['normalize']:
+                        records = normalize_records(records, OUTPUT_COLUMNS)
+                    results.put(('page', worker_id, shard.id,
+                                 [(review_fingerprint(record), record) for record in records]))
+            except Exception as e:
+                error = str(e) or type(e).__name__
+
+            # Sent before 'done', so the parent does not hand this worker another shard
+            memory_limit = options.get('memory_limit_mb')
+            recycle = memory_limit and current_rss_mb() > memory_limit
+            if recycle:
+                results.put(('recycle', worker_id, shard.id, f"{current_rss_mb():.0f} MB in use"))
+            results.put(('done', worker_id, shard.id, error))
+            if recycle:
+                break
+    finally:
+        pool.close()
+        if fetcher is not None:
+            fetcher.close()
+
+class ResultMerger:
+    """
+    Write the pages of every shard to per-property outputs in review order.
+
+    Pages of a property's first unfinished shard are written as they arrive;
+    pages of later shards are held until the shards before them finish.
+    Reviews seen before, e.g. repeated across shard boundaries or sent again
+    by a retried shard, are dropped, and ids are assigned in output order.
+
+    Args:
+        shards (list): Every Shard being scraped
+        sink_factory (callable): Called as sink_factory(url) and returning the
+                                 sinks a property is written to
+    """
+
+    def __init__(self, shards, sink_factory):
+        self._shards = {shard.id: shard for shard in shards}
+        self._sink_factory = sink_factory
+        self._properties = {}
+
+        for shard in shards:
+            state = self._properties.setdefault(shard.url, {
+                'shards': [], 'next': 0, 'buffers': {}, 'finished': set(), 'seen': set(),
+                'sinks': None, 'next_id': 1, 'duplicates': 0, 'errors': []
+            })
+            state['shards'].append(shard.id)
+
+    def _write(self, state, url, records):
+        if state['sinks'] is None:
+            state['sinks'] = self._sink_factory(url)
+
+        rows = []
+        for fingerprint, record in records:
+            if fingerprint in state['seen']:
+                state['duplicates'] += 1
+                continue
+            state['seen'].add(fingerprint)
+            rows.append(dict(record, id=state['next_id']))
+            state['next_id'] += 1
+
+        for sink in state['sinks']:
+            sink.write(rows)
+
+    def add_page(self, shard_id, records):
+        """Write a page now if its shard is next in order, otherwise hold it."""
+        shard = self._shards[shard_id]
+        state = self._properties[shard.url]
+
+        if state['next'] < len(state['shards']) and state['shards'][state['next']] == shard_id:
+            self._write(state, shard.url, records)
+        else:
+            state['buffers'].setdefault(shard_id, []).append(records)
+
+    def finish_shard(self, shard_id, error=None):
+        """Mark a shard finished and write the held pages of the shards now next in order."""
+        shard = self._shards[shard_id]
+        state = self._properties[shard.url]
+        state['finished'].add(shard_id)
+        if error:
+            state['errors'].append(f"reviews {shard.offset}+: {error}")
+
+        while state['next'] < len(state['shards']):
+            current = state['shards'][state['next']]
+            for records in state['buffers'].pop(current, []):
+                self._write(state, shard.url, records)
+            if current not in state['finished']:
+                break
+            state['next'] += 1
+
+        if state['next'] == len(state['shards']) and state['sinks'] is not None:
+            for sink in state['sinks']:
+                sink.close()
+
+    def summary(self):
+        """Return reviews written, duplicates dropped and errors per property."""
+        return {url: {'reviews': state['next_id'] - 1,
+                      'duplicates': state['duplicates'],
+                      'errors': state['errors']}
+                for url, state in self._properties.items()}
+
+def scrape_in_processes(urls, max_reviews=None, workers=None, sessions=1, shard_size=None,
+                        memory_limit_mb=None, address_space_limit_mb=None, retries=1,
+                        output_dir=".", store_path=None, backend='selenium', http_concurrency=4,
+                        page_timeout=15, extraction='js', navigation='direct', max_uses=20,
+                        normalize=True, driver_factory=None, log_dir=None, search_path=None):
+    """
+    Scrape properties in parallel worker processes that share nothing.
+
+    Each worker process runs its own browser sessions, so scraping and
+    normalization use several cores. Workers stream pages back over a queue
+    to a merger in this process. The merger writes each property's CSV (and
+    the review store and search index) in order, drops duplicate reviews and assigns ids.
+
+    Args:
+        urls (iterable): Booking.com property URLs
+        max_reviews (int, optional): Maximum number of reviews per property
+        workers (int, optional): Worker processes; defaults to the CPU count
+        sessions (int): Browser sessions per worker
+        shard_size (int, optional): Split each property into ranges of this
+                                    many reviews, scraped by different
+                                    workers. Requires max_reviews and
+                                    'direct' navigation.
+        memory_limit_mb (float, optional): A worker whose resident memory
+                                           exceeds this after a shard is
+                                           replaced by a fresh process
+        address_space_limit_mb (float, optional): Hard RLIMIT_AS for each
+                                                  worker. Browsers inherit
+                                                  it, so only use it with
+                                                  the 'http' backend.
+        retries (int): Extra attempts for a shard whose worker fails or dies
+        output_dir (str): Directory the per-property CSV files are written to
+        store_path (str, optional): Also upsert every review into this ReviewStore
+        search_path (str, optional): Also add every review to this SearchIndex
+        backend (str): 'selenium', or 'http' to try HttpFetcher first. Ranges
+                       after a property's first shard always use the browser.
+        driver_factory (callable, optional): Starts each worker's drivers. It
+                                             is sent to the workers, so it
+                                             must be a module-level function.
+        log_dir (str, optional): Directory each worker also writes a log file to
+        Other arguments as for scrape_booking_reviews.
+
+    Returns:
+        dict: Per property URL, the reviews written, duplicates dropped and errors
+    """
+    from scrapers.booking_scraper import get_csv_filename
+    from scrapers.sinks import CsvSink
+    from scrapers.storage import ReviewStore, SqliteSink
+    from scrapers.search import SearchIndex, SearchSink
+
+    urls = list(urls)
+    invalid = [url for url in urls if not validate_booking_url(url)]
+    if invalid:
+        raise ValueError(f"Invalid Booking.com URLs: {', '.join(invalid)}")
+    if shard_size and navigation != 'direct':
+        raise ValueError("shard_size requires 'direct' navigation")
+
+    shards = plan_shards(urls, max_reviews, shard_size)
+    if not shards:
+        return {}
+
+    store = ReviewStore(store_path) if store_path else None
+    search_index = SearchIndex(search_path) if search_path else None
+    def sinks_for(url):
+        sinks = [CsvSink(os.path.join(output_dir, get_csv_filename(url)))]
+        if store is not None:
+            sinks.append(SqliteSink(store, url))
+        if search_index is not None:
+            sinks.append(SearchSink(search_index, url))
+        return sinks
+
+    merger = ResultMerger(shards, sinks_for)
+    options = {
+        'sessions': sessions, 'max_uses': max_uses, 'backend': backend,
+        'http_concurrency': http_concurrency, 'page_timeout': page_timeout, 'extraction': extraction,
+        'navigation': navigation, 'normalize': normalize, 'memory_limit_mb': memory_limit_mb,
+        'address_space_limit_mb': address_space_limit_mb, 'driver_factory': driver_factory,
+        'log_dir': log_dir
+    }
+
+    # Forking a process that runs Flask and browser threads can copy held locks, so start clean
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    backlog = deque(shards)
+    workers = min(workers or os.cpu_count() or 1, len(shards))
+    processes = {}
+    inboxes = {}
+    # Shards are handed out one at a time, so the parent always knows what a worker is running
+    assigned = {}
+    retiring = set()
+    attempts = Counter()
+    pending = {shard.id for shard in shards}
+    worker_ids = count(1)
+
+    def spawn():
+        worker_id = next(worker_ids)
+        inboxes[worker_id] = context.Queue()
+        process = context.Process(target=_worker_main, args=(worker_id, inboxes[worker_id], results, options),
+                                  name=f"scrape-worker-{worker_id}", daemon=True)
+        process.start()
+        processes[worker_id] = process
+        dispatch(worker_id)
+
+    def dispatch(worker_id):
+        if backlog:
+            assigned[worker_id] = backlog.popleft()
+            inboxes[worker_id].put(assigned[worker_id])
+
+    def fail(shard, error):
+        """Retry a failed shard ahead of the others, or give up on it."""
+        attempts[shard.id] += 1
+        if attempts[shard.id] <= retries:
+            logger.warning(f"Retrying reviews {shard.offset}+ of {shard.url} after: {error}")
+            backlog.appendleft(shard)
+        else:
+            pending.discard(shard.id)
+            merger.finish_shard(shard.id, error)
+
+    for _ in range(workers):
+        spawn()
+    logger.info(f"Scraping {len(urls)} properties as {len(shards)} shards in {workers} processes")
+
+    last_check = time.monotonic()
+    try:
+        while pending:
+            try:
+                kind, worker_id, shard_id, payload = results.get(timeout=LIVENESS_INTERVAL)
+                if kind == 'page':
+                    merger.add_page(shard_id, payload)
+                elif kind == 'recycle':
+                    logger.info(f"Replacing worker {worker_id}: {payload}")
+                    retiring.add(worker_id)
+                elif kind == 'done':
+                    shard = assigned.pop(worker_id)
+                    if payload:
+                        fail(shard, payload)
+                    else:
+                        pending.discard(shard_id)
+                        merger.finish_shard(shard_id)
+                    if worker_id not in retiring:
+                        dispatch(worker_id)
+            except queue.Empty:
+                pass
+
+            if time.monotonic() - last_check < LIVENESS_INTERVAL:
+                continue
+            last_check = time.monotonic()
+
+            # Replace workers that exited, retrying the shard a crashed one was running
+            for worker_id, process in list(processes.items()):
+                if process.is_alive():
+                    continue
+                del processes[worker_id], inboxes[worker_id]
+                retiring.discard(worker_id)
+                shard = assigned.pop(worker_id, None)
+                if shard is not None:
+                    fail(shard, f"worker exited with code {process.exitcode}")
+            while backlog and len(processes) < workers:
+                spawn()
+            # Hand out shards sent back for a retry
+            for worker_id in processes:
+                if worker_id not in assigned and worker_id not in retiring:
+                    dispatch(worker_id)
+    finally:
+        for inbox in inboxes.values():
+            inbox.put(None)
+        for process in processes.values():
+            process.join(timeout=30)
+            if process.is_alive():
+                process.terminate()
+
+    return merger.summary()